@@ -1,18 +1,34 @@
 """Integration tests for the API endpoints."""
 
 import pytest
+import pytest_asyncio
 import httpx
-from fastapi.testclient import TestClient
+import orjson
+from collections import OrderedDict
+from unittest.mock import AsyncMock, MagicMock, patch
+from word_column_mapper.core import SearchEngine
 from word_column_mapper.main import app
 
+pytestmark = pytest.mark.asyncio
+
 
 class TestAPI:
     """Integration tests for API endpoints."""
     
+    @pytest_asyncio.fixture
+    async def client(self):
+        """Create an async client that calls the app in-process."""
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            yield client
+    
     @pytest.fixture
-    def client(self):
-        """Create a test client."""
-        return TestClient(app)
+    def engine(self, monkeypatch):
+        """Swap a fresh, empty engine into the API modules under test."""
+        engine = SearchEngine()
+        monkeypatch.setattr("word_column_mapper.api.health.search_engine", engine)
+        monkeypatch.setattr("word_column_mapper.api.operations.search_engine", engine)
+        return engine
     
     @pytest.fixture
     def sample_mappings(self):
@@ -25,9 +41,30 @@ class TestAPI:
             "customer_id": ["column1001", "column2001"]
         }
     
-    def test_root_endpoint(self, client):
+    @pytest.fixture
+    def claude_reply(self, monkeypatch, engine, sample_mappings):
+        """Return a function that stubs Claude's reply text over a loaded, isolated engine."""
+        engine.load_mappings(sample_mappings)
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+        monkeypatch.setattr("word_column_mapper.api.operations._anthropic_client", None)
+        monkeypatch.setattr("word_column_mapper.api.operations._keyword_cache", OrderedDict())
+        
+        def stub(text):
+            reply = MagicMock()
+            reply.content = [MagicMock(text=text)]
+            anthropic_client = MagicMock()
+            anthropic_client.messages.create = AsyncMock(return_value=reply)
+            monkeypatch.setattr(
+                "word_column_mapper.api.operations.AsyncAnthropic",
+                MagicMock(return_value=anthropic_client)
+            )
+            return anthropic_client
+        
+        return stub
+    
+    async def test_root_endpoint(self, client):
         """Test the root endpoint."""
-        response = client.get("/")
+        response = await client.get("/")
         assert response.status_code == 200
         
         data = response.json()
@@ -35,9 +72,9 @@ class TestAPI:
         assert data["version"] == "1.0.0"
         assert data["status"] == "running"
     
-    def test_api_info_endpoint(self, client):
+    async def test_api_info_endpoint(self, client):
         """Test the API info endpoint."""
-        response = client.get("/api")
+        response = await client.get("/api")
         assert response.status_code == 200
         
         data = response.json()
@@ -45,9 +82,9 @@ class TestAPI:
         assert "features" in data
         assert "performance" in data
     
-    def test_search_exact_match(self, client):
+    async def test_search_exact_match(self, client):
         """Test exact search functionality."""
-        response = client.get("/api/v1/search/date")
+        response = await client.get("/api/v1/search/date")
         assert response.status_code == 200
         
         data = response.json()
@@ -57,9 +94,9 @@ class TestAPI:
         assert data["results"][0]["confidence"] == 1.0
         assert data["results"][0]["match_type"] == "exact"
     
-    def test_search_fuzzy_match(self, client):
+    async def test_search_fuzzy_match(self, client):
         """Test fuzzy search functionality."""
-        response = client.get("/api/v1/search/dat")
+        response = await client.get("/api/v1/search/dat")
         assert response.status_code == 200
         
         data = response.json()
@@ -67,17 +104,17 @@ class TestAPI:
         assert data["total_results"] > 0
         assert data["results"][0]["confidence"] > 0.0
     
-    def test_search_with_parameters(self, client):
+    async def test_search_with_parameters(self, client):
         """Test search with query parameters."""
-        response = client.get("/api/v1/search/dat?fuzzy_threshold=0.8&max_results=5")
+        response = await client.get("/api/v1/search/dat?fuzzy_threshold=0.8&max_results=5")
         assert response.status_code == 200
         
         data = response.json()
         assert data["total_results"] <= 5
     
-    def test_search_no_match(self, client):
+    async def test_search_no_match(self, client):
         """Test search with no matches."""
-        response = client.get("/api/v1/search/xyz123")
+        response = await client.get("/api/v1/search/xyz123")
         assert response.status_code == 200
         
         data = response.json()
@@ -85,7 +122,7 @@ class TestAPI:
         assert data["results"] == []
         assert data["suggestions"] is not None
     
-    def test_search_with_body(self, client):
+    async def test_search_with_body(self, client):
         """Test search with request body."""
         request_data = {
             "query": "dat",
@@ -94,13 +131,13 @@ class TestAPI:
             "include_suggestions": True
         }
         
-        response = client.post("/api/v1/search", json=request_data)
+        response = await client.post("/api/v1/search", json=request_data)
         assert response.status_code == 200
         
         data = response.json()
         assert data["total_results"] <= 3
     
-    def test_batch_search(self, client):
+    async def test_batch_search(self, client):
         """Test batch search functionality."""
         request_data = {
             "queries": ["date", "dat", "start_date"],
@@ -108,25 +145,25 @@ class TestAPI:
             "max_results": 5
         }
         
-        response = client.post("/api/v1/search/batch", json=request_data)
+        response = await client.post("/api/v1/search/batch", json=request_data)
         assert response.status_code == 200
         
         data = response.json()
         assert len(data) == 3
         assert all("query" in result for result in data)
     
-    def test_suggestions_endpoint(self, client):
+    async def test_suggestions_endpoint(self, client):
         """Test suggestions endpoint."""
-        response = client.get("/api/v1/suggestions/dat")
+        response = await client.get("/api/v1/suggestions/dat")
         assert response.status_code == 200
         
         data = response.json()
         assert isinstance(data, list)
         assert "date" in data
     
-    def test_get_all_words(self, client):
+    async def test_get_all_words(self, client):
         """Test getting all indexed words."""
-        response = client.get("/api/v1/words")
+        response = await client.get("/api/v1/words")
         assert response.status_code == 200
         
         data = response.json()
@@ -134,9 +171,9 @@ class TestAPI:
         assert "date" in data
         assert "start_date" in data
     
-    def test_reverse_lookup(self, client):
+    async def test_reverse_lookup(self, client):
         """Test reverse lookup functionality."""
-        response = client.get("/api/v1/reverse/column5738")
+        response = await client.get("/api/v1/reverse/column5738")
         assert response.status_code == 200
         
         data = response.json()
@@ -145,14 +182,14 @@ class TestAPI:
         assert "start_date" in data["words"]
         assert data["total_mappings"] == 2
     
-    def test_reverse_lookup_not_found(self, client):
+    async def test_reverse_lookup_not_found(self, client):
         """Test reverse lookup with non-existent column."""
-        response = client.get("/api/v1/reverse/column9999")
+        response = await client.get("/api/v1/reverse/column9999")
         assert response.status_code == 404
     
-    def test_get_all_columns(self, client):
+    async def test_get_all_columns(self, client):
         """Test getting all column IDs."""
-        response = client.get("/api/v1/columns")
+        response = await client.get("/api/v1/columns")
         assert response.status_code == 200
         
         data = response.json()
@@ -160,9 +197,9 @@ class TestAPI:
         assert "column3423" in data
         assert "column5738" in data
     
-    def test_intersection_operation(self, client):
+    async def test_intersection_operation(self, client):
         """Test intersection operation."""
-        response = client.get("/api/v1/intersection?words=date&words=start_date")
+        response = await client.get("/api/v1/intersection?words=date&words=start_date")
         assert response.status_code == 200
         
         data = response.json()
@@ -171,9 +208,9 @@ class TestAPI:
         assert "column4632" in data["intersection_columns"]
         assert data["total_common_columns"] == 2
     
-    def test_union_operation(self, client):
+    async def test_union_operation(self, client):
         """Test union operation."""
-        response = client.get("/api/v1/union?words=start_date&words=end_date")
+        response = await client.get("/api/v1/union?words=start_date&words=end_date")
         assert response.status_code == 200
         
         data = response.json()
@@ -182,23 +219,149 @@ class TestAPI:
         assert "column3423" in data["union_columns"]
         assert "column3846" in data["union_columns"]
     
-    def test_set_operation_with_body(self, client):
+    async def test_set_operation_with_body(self, client):
         """Test set operation with request body."""
         request_data = {
             "words": ["date", "start_date"],
             "operation": "intersection"
         }
         
-        response = client.post("/api/v1/operations", json=request_data)
+        response = await client.post("/api/v1/operations", json=request_data)
         assert response.status_code == 200
         
         data = response.json()
         assert data["operation"] == "AND"
         assert data["total_common_columns"] == 2
     
-    def test_health_check(self, client):
+    async def test_set_operation_keeps_query_words(self, client, engine, sample_mappings):
+        """Test that the body's words are echoed back as sent."""
+        engine.load_mappings(sample_mappings)
+        request_data = {
+            "words": ["start_date", "end_date", "start_date"],
+            "operation": "union"
+        }
+        
+        response = await client.post("/api/v1/operations", json=request_data)
+        assert response.status_code == 200
+        
+        data = response.json()
+        assert data["query_words"] == ["start_date", "end_date", "start_date"]
+        assert data["total_unique_columns"] == 4
+    
+    async def test_batch_set_operation(self, client, engine, sample_mappings):
+        """Test several set operations in one request."""
+        engine.load_mappings(sample_mappings)
+        request_data = {
+            "operations": [
+                {"words": ["start_date", "date"], "operation": "intersection"},
+                {"words": ["start_date", "end_date"], "operation": "or"}
+            ]
+        }
+
+        response = await client.post("/api/v1/operations/batch", json=request_data)
+        assert response.status_code == 200
+
+        data = response.json()
+        assert [result["operation"] for result in data] == ["AND", "OR"]
+        assert data[0]["query_words"] == ["start_date", "date"]
+        assert data[0]["total_common_columns"] == 2
+        assert data[1]["total_unique_columns"] == 4
+
+    async def test_get_table_names(self, client):
+        """Test mapping column IDs to table names."""
+        column_ids = ["column58717", "column36178", "column_missing"]
+        
+        for _ in range(2):  # Second call is served from the cached mapping
+            response = await client.post("/api/v1/get-table-names", json=column_ids)
+            assert response.status_code == 200
+            
+            data = response.json()
+            assert data["table_names"] == ["table425", "table425"]
+            assert data["unique_table_names"] == ["table425"]
+            assert data["not_found_columns"] == ["column_missing"]
+    
+    async def test_natural_language_query(self, client, claude_reply):
+        """Test the natural language flow with a stubbed Claude reply."""
+        anthropic_client = claude_reply('["start_date", "user_id"]')
+        
+        response = await client.post(
+            "/api/v1/natural-language-query", json={"query": "when did users start"}
+        )
+        
+        assert response.status_code == 200
+        anthropic_client.messages.create.assert_awaited_once()
+        
+        data = response.json()
+        assert data["relevant_words"] == ["start_date", "user_id"]
+        assert all(r["search_result"]["exact_match"] for r in data["search_results"])
+        assert data["search_results"][0]["columns"][:2] == ["column5738", "column4632"]
+
+    async def test_anthropic_client_reused(self, monkeypatch):
+        """Test that the Claude client is built once per API key."""
+        from word_column_mapper.api import operations
+        
+        monkeypatch.setattr(operations, "_anthropic_client", None)
+        
+        with patch(
+            "word_column_mapper.api.operations.AsyncAnthropic",
+            side_effect=lambda api_key: MagicMock(api_key=api_key)
+        ) as client_class:
+            first = operations._get_anthropic_client("key-1")
+            assert operations._get_anthropic_client("key-1") is first
+            assert client_class.call_count == 1
+            
+            assert operations._get_anthropic_client("key-2").api_key == "key-2"
+            assert client_class.call_count == 2
+    
+    async def test_natural_language_query_empty(self, client):
+        """Test that a blank query is rejected before Claude is called."""
+        response = await client.post("/api/v1/natural-language-query", json={"query": "   "})
+        assert response.status_code == 400
+        assert response.json()["error"] == "Query is required"
+    
+    async def test_natural_language_query_reuses_keywords(self, client, claude_reply):
+        """Test that a repeated query does not call Claude again."""
+        anthropic_client = claude_reply('["user_id"]')
+        
+        first = await client.post(
+            "/api/v1/natural-language-query", json={"query": "list every user"}
+        )
+        second = await client.post(
+            "/api/v1/natural-language-query", json={"query": "list every user"}
+        )
+
+        anthropic_client.messages.create.assert_awaited_once()
+        assert first.json()["keywords_cache_hit"] is False
+        assert second.json()["keywords_cache_hit"] is True
+        assert second.json()["relevant_words"] == ["user_id"]
+
+    async def test_natural_language_query_non_json_reply(self, client, claude_reply):
+        """Test that keywords are still extracted when Claude's reply is not JSON."""
+        claude_reply("['start_date', 'user id', x]")
+        
+        response = await client.post(
+            "/api/v1/natural-language-query", json={"query": "start dates per user"}
+        )
+        
+        assert response.status_code == 200
+        assert response.json()["relevant_words"] == ["start_date", "user id"]
+    
+    async def test_natural_language_query_dedupes_keywords(self, client, claude_reply):
+        """Test that repeated keywords are searched only once."""
+        claude_reply('["start_date", "Start_Date", " user_id ", "", 7]')
+        
+        response = await client.post(
+            "/api/v1/natural-language-query", json={"query": "user start dates"}
+        )
+        
+        data = response.json()
+        assert data["relevant_words"] == ["start_date", "user_id"]
+        assert [r["word"] for r in data["search_results"]] == ["start_date", "user_id"]
+    
+    async def test_health_check(self, client, engine, sample_mappings):
         """Test health check endpoint."""
-        response = client.get("/api/v1/health")
+        engine.load_mappings(sample_mappings)
+        response = await client.get("/api/v1/health")
         assert response.status_code == 200
         
         data = response.json()
@@ -206,9 +369,36 @@ class TestAPI:
         assert data["version"] == "1.0.0"
         assert "dependencies" in data
     
-    def test_metrics_endpoint(self, client):
+    async def test_health_check_deep(self, client, engine, sample_mappings):
+        """Test that a deep health check runs a search without failing."""
+        engine.load_mappings(sample_mappings)
+        response = await client.get("/api/v1/health", params={"deep": "true"})
+        assert response.status_code == 200
+        assert response.json()["dependencies"]["search_engine"] == "healthy"
+    
+    async def test_health_check_not_loaded(self, client, engine):
+        """Test that an engine without mappings reports unhealthy."""
+        response = await client.get("/api/v1/health")
+        assert response.status_code == 200
+        
+        data = response.json()
+        assert data["status"] == "unhealthy"
+        assert data["dependencies"]["search_engine"] == "unhealthy"
+    
+    async def test_readiness_check(self, client, engine, sample_mappings):
+        """Test that the readiness probe waits for mappings to load."""
+        response = await client.get("/api/v1/health/ready")
+        assert response.status_code == 503
+        assert response.json()["status"] == "not_ready"
+        
+        engine.load_mappings(sample_mappings)
+        response = await client.get("/api/v1/health/ready")
+        assert response.status_code == 200
+        assert response.json()["status"] == "ready"
+    
+    async def test_metrics_endpoint(self, client):
         """Test metrics endpoint."""
-        response = client.get("/api/v1/metrics")
+        response = await client.get("/api/v1/metrics")
         assert response.status_code == 200
         
         data = response.json()
@@ -216,9 +406,9 @@ class TestAPI:
         assert "average_response_time_ms" in data
         assert "memory_usage_mb" in data
     
-    def test_detailed_metrics(self, client):
+    async def test_detailed_metrics(self, client):
         """Test detailed metrics endpoint."""
-        response = client.get("/api/v1/metrics/detailed")
+        response = await client.get("/api/v1/metrics/detailed")
         assert response.status_code == 200
         
         data = response.json()
@@ -226,9 +416,9 @@ class TestAPI:
         assert "index_metrics" in data
         assert "system_metrics" in data
     
-    def test_performance_benchmarks(self, client):
+    async def test_performance_benchmarks(self, client):
         """Test performance benchmarks endpoint."""
-        response = client.get("/api/v1/metrics/performance")
+        response = await client.get("/api/v1/metrics/performance")
         assert response.status_code == 200
         
         data = response.json()
@@ -236,13 +426,13 @@ class TestAPI:
         assert "performance_targets" in data
         assert "performance_status" in data
     
-    def test_load_mappings(self, client):
+    async def test_load_mappings(self, client):
         """Test loading mappings endpoint."""
         mappings = {
             "test_word": ["test_column1", "test_column2"]
         }
         
-        response = client.post("/api/v1/mappings", json=mappings)
+        response = await client.post("/api/v1/mappings", json=mappings)
         assert response.status_code == 200
         
         data = response.json()
@@ -250,59 +440,158 @@ class TestAPI:
         assert data["total_words"] == 1
         assert data["total_mappings"] == 2
     
-    def test_remove_mapping(self, client):
+    async def test_remove_mapping(self, client):
         """Test removing mapping endpoint."""
         # First add a mapping
         mappings = {"test_word": ["test_column"]}
-        client.post("/api/v1/mappings", json=mappings)
+        await client.post("/api/v1/mappings", json=mappings)
         
         # Then remove it
-        response = client.delete("/api/v1/mappings/test_word")
+        response = await client.delete("/api/v1/mappings/test_word")
         assert response.status_code == 200
         
         data = response.json()
         assert "removed successfully" in data["message"]
     
-    def test_remove_mapping_not_found(self, client):
+    async def test_remove_mapping_not_found(self, client):
         """Test removing non-existent mapping."""
-        response = client.delete("/api/v1/mappings/nonexistent")
+        response = await client.delete("/api/v1/mappings/nonexistent")
         assert response.status_code == 404
     
-    def test_error_handling_invalid_query(self, client):
+    async def test_error_handling_invalid_query(self, client):
         """Test error handling for invalid queries."""
         # Query too long
         long_query = "x" * 101
-        response = client.get(f"/api/v1/search/{long_query}")
-        assert response.status_code == 400
+        response = await client.get(f"/api/v1/search/{long_query}")
+        assert response.status_code == 422  # Validation error
     
-    def test_error_handling_invalid_parameters(self, client):
+    async def test_error_handling_invalid_parameters(self, client):
         """Test error handling for invalid parameters."""
         # Invalid fuzzy threshold
-        response = client.get("/api/v1/search/date?fuzzy_threshold=1.5")
+        response = await client.get("/api/v1/search/date?fuzzy_threshold=1.5")
         assert response.status_code == 422  # Validation error
     
-    def test_cors_headers(self, client):
+    async def test_cors_headers(self, client):
         """Test CORS headers are present."""
-        response = client.options("/api/v1/search/date")
+        response = await client.options("/api/v1/search/date")
         # CORS headers should be present (handled by middleware)
         assert response.status_code in [200, 204]
     
-    def test_content_type_headers(self, client):
+    async def test_content_type_headers(self, client):
         """Test content type headers."""
-        response = client.get("/api/v1/search/date")
+        response = await client.get("/api/v1/search/date")
         assert response.headers["content-type"] == "application/json"
     
-    def test_response_time_performance(self, client):
+    async def test_response_time_performance(self, client):
         """Test that response times are within acceptable limits."""
         import time
         
-        start_time = time.time()
-        response = client.get("/api/v1/search/date")
-        end_time = time.time()
+        start_time = time.perf_counter_ns()
+        response = await client.get("/api/v1/search/date")
+        end_time = time.perf_counter_ns()
         
         assert response.status_code == 200
-        assert (end_time - start_time) < 1.0  # Should be very fast
+        assert (end_time - start_time) / 1e9 < 1.0  # Should be very fast
         
         # Check that the API reports reasonable execution time
         data = response.json()
         assert data["execution_time_ms"] < 100  # Should be under 100ms
+    
+    async def test_run_mapping_step(self):
+        """Test that recreate-mappings steps report their result or error."""
+        from word_column_mapper.api.operations import _run_mapping_step
+        
+        step, value, unfinished = await _run_mapping_step("ok", lambda: 42, timeout=30)
+        assert step["status"] == "success"
+        assert value == 42
+        assert unfinished is None
+        
+        def fail():
+            raise RuntimeError("boom")
+        
+        step, value, unfinished = await _run_mapping_step("fail", fail, timeout=30)
+        assert step["status"] == "error"
+        assert step["error"] == "boom"
+        assert value is None
+        assert unfinished is None
+    
+    async def test_recreate_mappings_single_flight(self, monkeypatch):
+        """Test that concurrent recreate requests share one run."""
+        import asyncio
+        from word_column_mapper.api import operations
+        
+        async def slow_recreate():
+            await asyncio.sleep(0.05)
+            return 200, {"status": "success"}, None
+        
+        run = AsyncMock(side_effect=slow_recreate)
+        monkeypatch.setattr(operations, "_recreate_mappings", run)
+        monkeypatch.setattr(operations, "_recreate_last", None)
+        monkeypatch.setattr(operations, "_recreate_lock", asyncio.Lock())
+        
+        first, second = await asyncio.gather(
+            operations.recreate_mappings(), operations.recreate_mappings()
+        )
+        
+        run.assert_awaited_once()
+        assert first is not second
+        assert first.body == second.body
+        
+        # A request made after that run finished starts a new one
+        await operations.recreate_mappings()
+        assert run.await_count == 2
+    
+    async def test_recreate_mappings_single_flight_failure(self, monkeypatch):
+        """Test that a failed run gives each waiting request its own response."""
+        import asyncio
+        import time
+        from word_column_mapper.api import operations
+        
+        def failing_dump():
+            time.sleep(0.05)
+            raise RuntimeError("database unavailable")
+        
+        dump = MagicMock(side_effect=failing_dump)
+        monkeypatch.setattr("word_column_mapper.get_all_column_names.main", dump)
+        monkeypatch.setattr(operations, "_recreate_last", None)
+        monkeypatch.setattr(operations, "_recreate_lock", asyncio.Lock())
+        
+        first, second = await asyncio.gather(
+            operations.recreate_mappings(), operations.recreate_mappings()
+        )
+        
+        dump.assert_called_once()
+        assert first is not second
+        assert first.status_code == second.status_code == 500
+        assert first.body == second.body
+        assert orjson.loads(second.body)["error"] == (
+            "get_all_column_names.py failed: database unavailable"
+        )
+    
+    async def test_recreate_mappings_timeout_keeps_lock(self, monkeypatch):
+        """Test that a timed-out step blocks the next run until its thread ends."""
+        import asyncio
+        import threading
+        from word_column_mapper.api import operations
+        
+        release_dump = threading.Event()
+        monkeypatch.setattr(
+            "word_column_mapper.get_all_column_names.main", lambda: release_dump.wait(5)
+        )
+        monkeypatch.setattr(operations, "COLUMN_DUMP_TIMEOUT", 0.05)
+        monkeypatch.setattr(operations, "_recreate_last", None)
+        monkeypatch.setattr(operations, "_recreate_lock", asyncio.Lock())
+        
+        response = await operations.recreate_mappings()
+        
+        assert response.status_code == 500
+        assert orjson.loads(response.body)["steps"][0]["status"] == "timeout"
+        # The dump thread is still running, so no other run may start
+        assert operations._recreate_lock.locked()
+        
+        release_dump.set()
+        for _ in range(100):
+            if not operations._recreate_lock.locked():
+                break
+            await asyncio.sleep(0.01)
+        assert not operations._recreate_lock.locked()
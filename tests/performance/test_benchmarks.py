@@ -10,17 +10,16 @@ from word_column_mapper.core.engine import SearchEngine
 class TestPerformanceBenchmarks:
     """Performance benchmark tests."""
     
-    @pytest.fixture
-    def large_engine(self):
-        """Create a search engine with a large dataset for performance testing."""
-        engine = SearchEngine(fuzzy_threshold=0.6)
-        
-        # Generate a large dataset
-        mappings = {}
-        for i in range(1000):
-            word = f"word_{i}"
-            columns = [f"column_{j}" for j in range(random.randint(1, 5))]
-            mappings[word] = columns
+    @pytest.fixture(scope="module")
+    def large_mappings(self):
+        """Generate a large dataset for performance testing."""
+        # Generate a large dataset; seeded so every run benchmarks the same data
+        rng = random.Random(0)
+        column_counts = rng.choices(range(1, 6), k=1000)
+        mappings = {
+            f"word_{i}": [f"column_{j}" for j in range(count)]
+            for i, count in enumerate(column_counts)
+        }
         
         # Add some realistic mappings
         realistic_mappings = {
@@ -42,7 +41,22 @@ class TestPerformanceBenchmarks:
         }
         
         mappings.update(realistic_mappings)
-        engine.load_mappings(mappings)
+        
+        return mappings
+    
+    @pytest.fixture(scope="module")
+    def large_engine(self, large_mappings):
+        """Create a search engine with a large dataset, shared by the module's read-only tests."""
+        engine = SearchEngine(fuzzy_threshold=0.6)
+        engine.load_mappings(large_mappings)
+        
+        return engine
+    
+    @pytest.fixture
+    def fresh_engine(self, large_mappings):
+        """Create a search engine with the large dataset and untouched statistics."""
+        engine = SearchEngine(fuzzy_threshold=0.6)
+        engine.load_mappings(large_mappings)
         
         return engine
     
@@ -108,15 +122,15 @@ class TestPerformanceBenchmarks:
             "product_id", "product", "created_at", "created", "updated_at", "updated"
         ]
         
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         results = []
         
         for query in queries:
             result = large_engine.search(query)
             results.append(result)
         
-        end_time = time.time()
-        total_time = end_time - start_time
+        end_time = time.perf_counter_ns()
+        total_time = (end_time - start_time) / 1e9
         
         # Should handle 18 queries in under 1 second
         assert total_time < 1.0
@@ -146,23 +160,8 @@ class TestPerformanceBenchmarks:
     
     def test_concurrent_access_simulation(self, large_engine):
         """Simulate concurrent access patterns."""
-        import threading
-        import queue
-        
-        results_queue = queue.Queue()
-        errors_queue = queue.Queue()
-        
-        def search_worker(queries):
-            """Worker function for concurrent searches."""
-            for query in queries:
-                try:
-                    result = large_engine.search(query)
-                    results_queue.put((query, result))
-                except Exception as e:
-                    errors_queue.put((query, str(e)))
-        
-        # Create multiple threads with different query sets
-        threads = []
+        from concurrent.futures import ThreadPoolExecutor
+        
         query_sets = [
             ["date", "start_date", "end_date"],
             ["user_id", "customer_id", "order_id"],
@@ -170,48 +169,35 @@ class TestPerformanceBenchmarks:
             ["email", "phone", "address"],
             ["name", "description", "timestamp"]
         ]
+        queries = [query for query_set in query_sets for query in query_set]
         
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
-        for queries in query_sets:
-            thread = threading.Thread(target=search_worker, args=(queries,))
-            threads.append(thread)
-            thread.start()
+        # Any exception raised in a worker is re-raised by map()
+        with ThreadPoolExecutor(max_workers=len(query_sets)) as executor:
+            results = list(executor.map(large_engine.search, queries))
         
-        # Wait for all threads to complete
-        for thread in threads:
-            thread.join()
-        
-        end_time = time.time()
-        total_time = end_time - start_time
+        end_time = time.perf_counter_ns()
+        total_time = (end_time - start_time) / 1e9
         
         # Should complete in reasonable time
         assert total_time < 2.0
         
-        # Check results
-        results = []
-        while not results_queue.empty():
-            results.append(results_queue.get())
-        
-        errors = []
-        while not errors_queue.empty():
-            errors.append(errors_queue.get())
-        
-        # Should have results and no errors
+        # Should have a result for every query
         assert len(results) == 15  # 5 threads * 3 queries each
-        assert len(errors) == 0
+        assert [result.query for result in results] == queries
     
     def test_large_query_performance(self, large_engine):
         """Test performance with large queries."""
         # Test with very long query
         long_query = "very_long_word_" + "x" * 50
         
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         result = large_engine.search(long_query)
-        end_time = time.time()
+        end_time = time.perf_counter_ns()
         
         # Should handle long queries gracefully
-        assert (end_time - start_time) < 1.0
+        assert (end_time - start_time) / 1e9 < 1.0
         assert result.total_results == 0  # No match expected
     
     def test_special_characters_performance(self, large_engine):
@@ -224,15 +210,15 @@ class TestPerformanceBenchmarks:
             "date@with@symbols"
         ]
         
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         results = []
         
         for query in special_queries:
             result = large_engine.search(query)
             results.append(result)
         
-        end_time = time.time()
-        total_time = end_time - start_time
+        end_time = time.perf_counter_ns()
+        total_time = (end_time - start_time) / 1e9
         
         # Should handle special characters efficiently
         assert total_time < 0.5
@@ -254,15 +240,15 @@ class TestPerformanceBenchmarks:
             "START_DATE", "Start_Date", "start_date", "StArT_dAtE"
         ]
         
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         results = []
         
         for query in case_variations:
             result = large_engine.search(query)
             results.append(result)
         
-        end_time = time.time()
-        total_time = end_time - start_time
+        end_time = time.perf_counter_ns()
+        total_time = (end_time - start_time) / 1e9
         
         # Should handle case variations efficiently
         assert total_time < 0.3
@@ -272,16 +258,16 @@ class TestPerformanceBenchmarks:
         exact_matches = sum(1 for r in results if r.exact_match)
         assert exact_matches >= 6  # At least 6 should be exact matches
     
-    def test_statistics_accuracy(self, large_engine):
+    def test_statistics_accuracy(self, fresh_engine):
         """Test that performance statistics are accurate."""
         # Perform various types of searches
-        large_engine.search("date")  # Exact match
-        large_engine.search("dat")   # Fuzzy match
-        large_engine.search("xyz")   # No match
-        large_engine.search("start_date")  # Exact match
-        large_engine.search("start_dat")   # Fuzzy match
+        fresh_engine.search("date")  # Exact match
+        fresh_engine.search("dat")   # Fuzzy match
+        fresh_engine.search("xyz")   # No match
+        fresh_engine.search("start_date")  # Exact match
+        fresh_engine.search("start_dat")   # Fuzzy match
         
-        stats = large_engine.get_stats()
+        stats = fresh_engine.get_stats()
         
         assert stats["total_queries"] == 5
         assert stats["exact_matches"] == 2
@@ -0,0 +1,53 @@
+"""Unit tests for the BK-tree index."""
+
+import pytest
+from word_column_mapper.core.bk_tree import BKTree
+from word_column_mapper.core.fuzzy_matcher import FuzzyMatcher
+
+
+class TestBKTree:
+    """Test cases for the BKTree class."""
+    
+    @pytest.fixture
+    def words(self):
+        """Sample words for testing."""
+        return ["date", "start_date", "end_date", "user_id", "customer_id", "data"]
+    
+    @pytest.fixture
+    def tree(self, words):
+        """Create a BK-tree over the sample words."""
+        tree = BKTree(FuzzyMatcher().weighted_edit_distance)
+        for idx, word in enumerate(words):
+            tree.add(word, idx)
+        return tree
+    
+    def test_empty_tree(self):
+        """Test searching an empty tree."""
+        tree = BKTree(FuzzyMatcher().weighted_edit_distance)
+        assert len(tree) == 0
+        assert tree.find("date", 3) == []
+    
+    def test_exact_lookup(self, tree, words):
+        """Test radius zero returns only exact keys."""
+        assert tree.find("date", 0) == [(0, words.index("date"))]
+    
+    def test_matches_brute_force(self, tree, words):
+        """Test radius queries against a linear scan."""
+        distance = FuzzyMatcher().weighted_edit_distance
+        for query in ["dat", "strt_date", "usr_id", "zzz"]:
+            for radius in range(0, 6):
+                expected = sorted(
+                    (distance(query, word), idx)
+                    for idx, word in enumerate(words)
+                    if distance(query, word) <= radius
+                )
+                assert sorted(tree.find(query, radius)) == expected
+    
+    def test_duplicate_keys(self):
+        """Test items sharing a key are all returned."""
+        tree = BKTree(FuzzyMatcher().weighted_edit_distance)
+        tree.add("date", "a")
+        tree.add("date", "b")
+        
+        assert len(tree) == 2
+        assert sorted(tree.find("date", 0)) == [(0, "a"), (0, "b")]
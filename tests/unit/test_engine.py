@@ -109,6 +109,15 @@ class TestSearchEngine:
         assert result.suggestions is not None
         # Suggestions might be empty if no similar words found
         assert isinstance(result.suggestions, list)
+
+    def test_no_match_suggestions_mixed_case_words(self, engine):
+        """Test that suggestions match stored words with capitals and spaces."""
+        engine.load_mappings({"Group Id": ["column1"], "Department Name": ["column2"]})
+
+        result = engine.search("Gxoup Id", max_edit_distance=1)
+
+        assert result.total_results == 0
+        assert result.suggestions == ["Group Id"]
     
     def test_reverse_search(self, engine, sample_mappings):
         """Test reverse lookup functionality."""
@@ -141,6 +150,16 @@ class TestSearchEngine:
         assert "column4632" in result["intersection_columns"]
         assert result["total_common_columns"] == 2
     
+    def test_intersection_search_normalized_words(self, engine, sample_mappings):
+        """Test set operations resolve words through normalization."""
+        engine.load_mappings(sample_mappings)
+        
+        result = engine.intersection_search(["DATE", "Start-Date"])
+        assert sorted(result["intersection_columns"]) == ["column4632", "column5738"]
+        
+        result = engine.union_search(["End Date", "missing"])
+        assert sorted(result["union_columns"]) == ["column3423", "column3846"]
+    
     def test_union_search(self, engine, sample_mappings):
         """Test union operation."""
         engine.load_mappings(sample_mappings)
@@ -264,3 +283,139 @@ class TestSearchEngine:
         assert date_result is not None
         assert date_result.changes is not None
         assert "Insert" in date_result.changes or "Delete" in date_result.changes or "Substitute" in date_result.changes
+    
+    def test_small_radius_matches_full_scan(self, engine, sample_mappings):
+        """Test that the BK-tree path agrees with the full scan."""
+        engine.load_mappings(sample_mappings)
+        
+        for query in ["dat", "strt_date", "user", "custmer_id"]:
+            tree = engine._fuzzy_search_with_edit_distance(query, 10, 2)
+            scan = [
+                r for r in engine._fuzzy_search_with_edit_distance(query, 10, 10)
+                if r.edit_distance <= 2
+            ]
+            assert [(r.word, r.edit_distance) for r in tree] == \
+                [(r.word, r.edit_distance) for r in scan]
+    
+    def test_remove_mapping(self, engine, sample_mappings):
+        """Test that removed words no longer appear in fuzzy results."""
+        engine.load_mappings(sample_mappings)
+        
+        assert engine.remove_mapping("date") is True
+        assert engine.remove_mapping("date") is False
+        
+        result = engine.search("dat")
+        assert all(r.word != "date" for r in result.results)
+    
+    def test_cache_hit_on_case_variation(self, engine, sample_mappings):
+        """Test that case variants of a query are served from the cache."""
+        engine.load_mappings(sample_mappings)
+        
+        first = engine.search("date")
+        second = engine.search("DaTe")
+        
+        assert first.cache_hit is False
+        assert second.cache_hit is True
+        assert second.query == "DaTe"
+        assert [r.word for r in second.results] == [r.word for r in first.results]
+        assert engine._stats["cache_hits"] == 1
+        assert engine._stats["cache_misses"] == 1
+    
+    def test_cache_shared_across_thresholds(self, engine, sample_mappings):
+        """Test that queries differing only in threshold share a cache entry."""
+        engine.load_mappings(sample_mappings)
+        
+        engine.search("dat", fuzzy_threshold=0.9)
+        result = engine.search("dat", fuzzy_threshold=0.3)
+        
+        assert result.cache_hit is True
+        assert engine.get_stats()["cache_size"] == 1
+    
+    def test_cache_disabled(self, sample_mappings):
+        """Test that a zero cache size turns memoization off."""
+        engine = SearchEngine(cache_size=0)
+        engine.load_mappings(sample_mappings)
+        
+        engine.search("date")
+        result = engine.search("date")
+        
+        assert result.cache_hit is False
+        assert result.exact_match is True
+        assert engine.get_stats()["cache_size"] == 0
+    
+    def test_cache_invalidated_on_load(self, engine, sample_mappings):
+        """Test that loading new mappings invalidates cached responses."""
+        engine.load_mappings(sample_mappings)
+        engine.search("order_id")
+        
+        engine.load_mappings({"order_id": ["column2001"]})
+        result = engine.search("order_id")
+        
+        assert result.cache_hit is False
+        assert result.exact_match is True
+    
+    def test_cached_response_isolated(self, engine, sample_mappings):
+        """Test that mutating a returned response does not affect the cache."""
+        engine.load_mappings(sample_mappings)
+        
+        first = engine.search("date")
+        first.results[0].columns.append("mutated")
+        
+        second = engine.search("date")
+        assert "mutated" not in second.results[0].columns
+    
+    def test_concurrent_search_and_reload(self, engine, sample_mappings):
+        """Test that searches stay consistent while mappings are reloaded."""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        engine.load_mappings(sample_mappings)
+        
+        def reload(i):
+            engine.load_mappings({f"extra_{i}": [f"column{i}"]})
+        
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            searches = [executor.submit(engine.search, "date") for _ in range(50)]
+            reloads = [executor.submit(reload, i) for i in range(10)]
+            for future in reloads:
+                future.result()
+            for future in searches:
+                assert future.result().exact_match is True
+        
+        assert engine.get_stats()["total_queries"] == 50
+    
+    def test_batch_search_matches_search(self, engine, sample_mappings):
+        """Test that batch search returns the same results as single searches."""
+        engine.load_mappings(sample_mappings)
+        queries = ["dat", "Start-Date", "user", "xyz123", "dat"]
+        
+        batch = engine.batch_search(queries)
+        
+        assert [r.query for r in batch] == queries
+        for query, response in zip(queries, batch):
+            single = engine.search(query)
+            assert response.exact_match == single.exact_match
+            assert response.suggestions == single.suggestions
+            assert [(r.word, r.confidence, r.edit_distance, r.columns) for r in response.results] == \
+                [(r.word, r.confidence, r.edit_distance, r.columns) for r in single.results]
+        assert engine.get_stats()["total_queries"] == 2 * len(queries)
+    
+    def test_batch_search_single_worker(self, sample_mappings):
+        """Test that batch results do not depend on the worker count."""
+        queries = ["dat", "Start-Date", "user", "xyz123"]
+        responses = []
+        for workers in (1, -1):
+            engine = SearchEngine(workers=workers)
+            engine.load_mappings(sample_mappings)
+            responses.append([r.results for r in engine.batch_search(queries)])
+        
+        assert responses[0] == responses[1]
+    
+    def test_results_ranked_across_length_buckets(self, engine, sample_mappings):
+        """Test that wide-radius results are ordered by distance, then confidence."""
+        engine.load_mappings(sample_mappings)
+        
+        for max_results in (1, 3, 50):
+            results = engine.search("strt_date", max_results=max_results).results
+            keys = [(r.edit_distance, -r.confidence) for r in results]
+            assert keys == sorted(keys)
+            assert results == engine.search("strt_date", max_results=50).results[:max_results]
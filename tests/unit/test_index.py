@@ -51,6 +51,27 @@ class TestForwardIndex:
         columns = forward_index.get_columns("nonexistent")
         assert columns is None
     
+    def test_resolve(self, forward_index):
+        """Test resolving words to their stored keys."""
+        forward_index.add_mapping("Start-Date", ["column1"])
+        
+        assert forward_index.resolve("Start-Date") == "Start-Date"
+        assert forward_index.resolve("start_date") == "Start-Date"
+        assert forward_index.resolve("nonexistent") is None
+    
+    def test_get_normalized_keys(self, forward_index):
+        """Test that normalized forms are stored once per word."""
+        forward_index.add_mapping("Start-Date", ["column1"])
+        forward_index.add_mapping("user_id", ["column2"])
+        
+        assert forward_index.get_normalized_keys() == {
+            "Start-Date": "start_date",
+            "user_id": "user_id"
+        }
+        
+        forward_index.remove_mapping("Start-Date")
+        assert forward_index.get_normalized_keys() == {"user_id": "user_id"}
+    
     def test_get_all_words(self, forward_index):
         """Test getting all words in the index."""
         forward_index.add_mapping("date", ["column1"])
@@ -166,6 +187,17 @@ class TestReverseIndex:
         assert "date" not in reverse_index._index["column2"]
         assert reverse_index._stats["total_columns"] == 0
     
+    def test_total_mappings_tracking(self, reverse_index):
+        """Test mapping totals stay consistent across adds and removes."""
+        reverse_index.add_mapping("date", ["column1", "column2"])
+        reverse_index.add_mapping("start_date", ["column1"])
+        reverse_index.add_mapping("date", ["column1"])  # Duplicate
+        assert reverse_index._stats["total_mappings"] == 3
+        
+        reverse_index.remove_mapping("date", ["column1", "column2", "column3"])
+        assert reverse_index._stats["total_mappings"] == 1
+        assert reverse_index._stats["total_columns"] == 1
+    
     def test_clear(self, reverse_index):
         """Test clearing all mappings."""
         reverse_index.add_mapping("date", ["column1"])
@@ -181,6 +213,15 @@ class TestReverseIndex:
         
         words = reverse_index.get_words("column1")
         assert words.count("date") == 1  # Should not have duplicates
+    
+    def test_get_words_preserves_insertion_order(self, reverse_index):
+        """Test that words come back in the order they were mapped."""
+        for word in ["user_id", "date", "start_date", "end_date"]:
+            reverse_index.add_mapping(word, ["column1"])
+        reverse_index.remove_mapping("date", ["column1"])
+        reverse_index.add_mapping("date", ["column1"])
+        
+        assert reverse_index.get_words("column1") == ["user_id", "start_date", "end_date", "date"]
 
 
 class TestIndexManager:
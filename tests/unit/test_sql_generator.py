@@ -10,9 +10,9 @@ from word_column_mapper.sql_generator_with_mcp import SQLGeneratorMCP
 class TestSQLGeneratorMCP:
     """Test cases for the SQLGeneratorMCP class."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def mock_schema(self):
-        """Mock schema data for testing."""
+        """Mock schema data for testing (shared by the class; do not mutate)."""
         return {
             "employees": {
                 "table_name": "employees",
@@ -51,6 +51,22 @@ class TestSQLGeneratorMCP:
             }
         }
     
+    @pytest.fixture(scope="class")
+    def schema_file(self, mock_schema, tmp_path_factory):
+        """Schema file shared by the tests in this class."""
+        schema_file = tmp_path_factory.mktemp("schema") / "test_schema.json"
+        schema_file.write_text(json.dumps(mock_schema))
+        return schema_file
+    
+    @pytest.fixture(scope="class")
+    def generator(self, mock_schema):
+        """Generator shared by the tests that do not exercise construction."""
+        with patch.dict(os.environ, {"DB_PASSWORD": "test", "OPENAI_API_KEY": "test"}):
+            return SQLGeneratorMCP(
+                schema=mock_schema,
+                debug=False
+            )
+    
     @pytest.fixture
     def mock_env_vars(self, monkeypatch):
         """Mock environment variables."""
@@ -61,28 +77,21 @@ class TestSQLGeneratorMCP:
         monkeypatch.setenv("DB_PASSWORD", "testpass")
         monkeypatch.setenv("OPENAI_API_KEY", "test-key-123")
     
-    def test_load_schema_file_exists(self, mock_schema, tmp_path):
+    def test_load_schema_file_exists(self, schema_file, mock_schema):
         """Test loading schema from file when file exists."""
-        # Create a temporary schema file
-        schema_file = tmp_path / "test_schema.json"
-        schema_file.write_text(json.dumps(mock_schema))
-        
         with patch.dict(os.environ, {"DB_PASSWORD": "test", "OPENAI_API_KEY": "test"}):
             generator = SQLGeneratorMCP(
                 schema_file_path=str(schema_file),
                 debug=False
             )
-            
-            assert generator.schema == mock_schema
-            assert len(generator.schema) == 2
-            assert "employees" in generator.schema
-            assert "departments" in generator.schema
+        
+        assert generator.schema == mock_schema
+        assert len(generator.schema) == 2
+        assert "employees" in generator.schema
+        assert "departments" in generator.schema
     
-    def test_initialization_with_db_config(self, mock_schema, tmp_path):
+    def test_initialization_with_db_config(self, mock_schema):
         """Test initialization with explicit database config."""
-        schema_file = tmp_path / "test_schema.json"
-        schema_file.write_text(json.dumps(mock_schema))
-        
         db_config = {
             "host": "testhost",
             "port": "5432",
@@ -93,7 +102,7 @@ class TestSQLGeneratorMCP:
         
         with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
             generator = SQLGeneratorMCP(
-                schema_file_path=str(schema_file),
+                schema=mock_schema,
                 db_config=db_config,
                 debug=False
             )
@@ -101,11 +110,8 @@ class TestSQLGeneratorMCP:
             assert generator.db_config["host"] == "testhost"
             assert generator.db_config["database"] == "testdb"
     
-    def test_initialization_requires_openai_key(self, mock_schema, tmp_path):
+    def test_initialization_requires_openai_key(self, mock_schema):
         """Test that initialization handles missing OpenAI API key."""
-        schema_file = tmp_path / "test_schema.json"
-        schema_file.write_text(json.dumps(mock_schema))
-        
         db_config = {
             "host": "testhost",
             "port": "5432",
@@ -120,7 +126,7 @@ class TestSQLGeneratorMCP:
         try:
             with patch.dict(os.environ, {}, clear=True):
                 generator = SQLGeneratorMCP(
-                    schema_file_path=str(schema_file),
+                    schema=mock_schema,
                     db_config=db_config,
                     openai_api_key="test-key-explicit",
                     debug=False
@@ -130,11 +136,8 @@ class TestSQLGeneratorMCP:
             # It's okay if it raises ValueError for missing key
             pass
     
-    def test_initialization_requires_db_password(self, mock_schema, tmp_path):
+    def test_initialization_requires_db_password(self, mock_schema):
         """Test that initialization handles missing database password."""
-        schema_file = tmp_path / "test_schema.json"
-        schema_file.write_text(json.dumps(mock_schema))
-        
         # Test without DB_PASSWORD - should raise or handle gracefully
         # Providing explicit db_config should work
         db_config = {
@@ -147,108 +150,58 @@ class TestSQLGeneratorMCP:
         
         with patch.dict(os.environ, {"OPENAI_API_KEY": "test"}):
             generator = SQLGeneratorMCP(
-                schema_file_path=str(schema_file),
+                schema=mock_schema,
                 db_config=db_config,
                 debug=False
             )
             assert generator.db_config["password"] == "testpass"
     
-    def test_get_relevant_tables(self, mock_schema, tmp_path):
+    def test_schema_passed_in_memory(self, generator, mock_schema):
+        """Test that a passed schema is used without reading a file."""
+        assert generator.schema is mock_schema
+        assert generator.traversal.schema is mock_schema
+    
+    def test_get_relevant_tables(self, generator):
         """Test getting relevant tables based on query."""
-        schema_file = tmp_path / "test_schema.json"
-        schema_file.write_text(json.dumps(mock_schema))
+        # Test with keyword matching
+        assert generator._get_relevant_tables("employee name", max_depth=1) == ["employees"]
+        assert generator._get_relevant_tables("department", max_depth=1) == ["departments"]
         
-        with patch.dict(os.environ, {"DB_PASSWORD": "test", "OPENAI_API_KEY": "test"}):
-            generator = SQLGeneratorMCP(
-                schema_file_path=str(schema_file),
-                debug=False
-            )
-            
-            # Test with keyword matching
-            tables = generator._get_relevant_tables("show all employees", max_depth=1)
-            
-            assert isinstance(tables, list)
-            assert len(tables) > 0
+        # Without keyword matches every table is considered
+        tables = generator._get_relevant_tables("show all employees", max_depth=1)
+        assert sorted(tables) == ["departments", "employees"]
     
-    def test_validate_sql_allowed_operation(self, mock_schema, tmp_path):
-        """Test SQL validation for allowed operations."""
-        schema_file = tmp_path / "test_schema.json"
-        schema_file.write_text(json.dumps(mock_schema))
+    @pytest.mark.parametrize("sql, expected_valid, keyword", [
+        # Valid SELECT query
+        ("SELECT * FROM employees WHERE emp_id = 1", True, None),
+        # Invalid DROP query
+        ("DROP TABLE employees", False, "drop"),
+        # Invalid INSERT query (not in allowed_operations)
+        ("INSERT INTO employees VALUES (1, 'John')", False, "insert"),
+    ], ids=["allowed_operation", "prohibited_keyword", "disallowed_operation"])
+    def test_validate_sql(self, generator, sql, expected_valid, keyword):
+        """Test SQL validation for allowed and prohibited operations."""
+        is_valid, message = generator._validate_sql_security(sql)
         
-        with patch.dict(os.environ, {"DB_PASSWORD": "test", "OPENAI_API_KEY": "test"}):
-            generator = SQLGeneratorMCP(
-                schema_file_path=str(schema_file),
-                debug=False
-            )
-            
-            # Valid SELECT query
-            valid_sql = "SELECT * FROM employees WHERE emp_id = 1"
-            is_valid, message = generator._validate_sql_security(valid_sql)
-            
-            assert is_valid is True
+        assert is_valid is expected_valid
+        if expected_valid:
             assert message is None
+        else:
+            assert "prohibited" in message.lower() and keyword in message.lower()
     
-    def test_validate_sql_prohibited_keywords(self, mock_schema, tmp_path):
-        """Test SQL validation rejects prohibited keywords."""
-        schema_file = tmp_path / "test_schema.json"
-        schema_file.write_text(json.dumps(mock_schema))
-        
-        with patch.dict(os.environ, {"DB_PASSWORD": "test", "OPENAI_API_KEY": "test"}):
-            generator = SQLGeneratorMCP(
-                schema_file_path=str(schema_file),
-                debug=False
-            )
-            
-            # Invalid DROP query
-            invalid_sql = "DROP TABLE employees"
-            is_valid, message = generator._validate_sql_security(invalid_sql)
-            
-            assert is_valid is False
-            assert "prohibited" in message.lower() and "drop" in message.lower()
-    
-    def test_validate_sql_disallowed_operation(self, mock_schema, tmp_path):
-        """Test SQL validation rejects disallowed operations."""
-        schema_file = tmp_path / "test_schema.json"
-        schema_file.write_text(json.dumps(mock_schema))
-        
-        with patch.dict(os.environ, {"DB_PASSWORD": "test", "OPENAI_API_KEY": "test"}):
-            generator = SQLGeneratorMCP(
-                schema_file_path=str(schema_file),
-                debug=False
-            )
-            
-            # Invalid INSERT query (not in allowed_operations)
-            invalid_sql = "INSERT INTO employees VALUES (1, 'John')"
-            is_valid, message = generator._validate_sql_security(invalid_sql)
-            
-            assert is_valid is False
-            assert "prohibited" in message.lower() and "insert" in message.lower()
-    
-    def test_extract_schemas_for_tables(self, mock_schema, tmp_path):
+    def test_extract_schemas_for_tables(self, generator):
         """Test extracting schemas for specific tables."""
-        schema_file = tmp_path / "test_schema.json"
-        schema_file.write_text(json.dumps(mock_schema))
+        relevant_schemas = generator._extract_table_schemas(["employees"])
         
-        with patch.dict(os.environ, {"DB_PASSWORD": "test", "OPENAI_API_KEY": "test"}):
-            generator = SQLGeneratorMCP(
-                schema_file_path=str(schema_file),
-                debug=False
-            )
-            
-            relevant_schemas = generator._extract_table_schemas(["employees"])
-            
-            assert "employees" in relevant_schemas
-            assert "columns" in relevant_schemas["employees"]
-            assert len(relevant_schemas["employees"]["columns"]) == 3
+        assert "employees" in relevant_schemas
+        assert "columns" in relevant_schemas["employees"]
+        assert len(relevant_schemas["employees"]["columns"]) == 3
     
-    def test_debug_mode_enabled(self, mock_schema, tmp_path, capsys):
+    def test_debug_mode_enabled(self, mock_schema, capsys):
         """Test that debug mode produces output."""
-        schema_file = tmp_path / "test_schema.json"
-        schema_file.write_text(json.dumps(mock_schema))
-        
         with patch.dict(os.environ, {"DB_PASSWORD": "test", "OPENAI_API_KEY": "test"}):
             generator = SQLGeneratorMCP(
-                schema_file_path=str(schema_file),
+                schema=mock_schema,
                 debug=True
             )
             
@@ -270,6 +223,19 @@ class TestSQLGeneratorMCP:
             
             # Should handle gracefully and return empty schema
             assert generator.schema == {}
+    
+    def test_schema_file_invalid_json(self, tmp_path):
+        """Test handling of a schema file that is not valid JSON."""
+        invalid_file = tmp_path / "invalid.json"
+        invalid_file.write_text("{not json")
+        
+        with patch.dict(os.environ, {"DB_PASSWORD": "test", "OPENAI_API_KEY": "test"}):
+            generator = SQLGeneratorMCP(
+                schema_file_path=str(invalid_file),
+                debug=False
+            )
+            
+            assert generator.schema == {}
 
 
 if __name__ == "__main__":
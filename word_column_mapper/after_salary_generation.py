@@ -3,37 +3,51 @@ CREATE OR REPLACE FUNCTION public.after_salary_generation_2_trigger()
  LANGUAGE plpython3u
 AS $function$
 
-query_check_depth = "SELECT pg_trigger_depth()"
-result = plpy.execute(query_check_depth)
+depth_plan = SD.get("check_depth_plan")
+if depth_plan is None:
+    query_check_depth = "SELECT pg_trigger_depth()"
+    depth_plan = plpy.prepare(query_check_depth)
+    SD["check_depth_plan"] = depth_plan
+result = plpy.execute(depth_plan)
 trigger_depth = result[0]["pg_trigger_depth"]
 
 if trigger_depth != 1:
     return 'OK'
 
-query="""select  COALESCE(sum(column70529),0) as sum from table4276 where column70530=%s"""%(TD["new"]["id"])
-monthly_gross_deduction=plpy.execute(query)[0]['sum']
-
-query="""select  COALESCE(sum(column70372),0) as sum from table4270 where column70384=%s"""%(TD["new"]["id"])
-earned_gross_salary=plpy.execute(query)[0]['sum']
-
-query="""select  COALESCE(sum(column70642),0) as sum from table4280 where column70643=%s"""%(TD["new"]["id"])
-monthly_contribution=plpy.execute(query)[0]['sum']
-
-
-query = """
+# One statement computes the three sums and applies the update; the plan is
+# prepared once per session and kept in SD for later trigger invocations
+plan = SD.get("update_salary_plan")
+if plan is None:
+    query = """
 UPDATE table545 AS a
-SET 
+SET
     column70359 = b.column69881,
-    column70544 = %s,
-    column70360 = %s,
-    column70579 = %s,
-    column70578 = %s,
-    column71128 = %s,
-    column71129 = %s,
-    column8575 =%s-%s
-    from (select %s as aid,* from table4107 AS B where b.column67397='%s' and b.column70293<=to_date('%s', 'yyyy-mm-dd') and (b.column70294 is null or b.column70294>=to_date('%s', 'yyyy-mm-dd')) limit 1) as b where a.id=%s and b.aid=%s""" %(monthly_gross_deduction, monthly_gross_deduction, earned_gross_salary, earned_gross_salary, monthly_contribution, monthly_contribution, earned_gross_salary, monthly_gross_deduction, TD["new"]["id"], TD["new"]["column8493"], TD["new"]["column8522"], TD["new"]["column8523"], TD["new"]["id"], TD["new"]["id"])
-
-plpy.execute(query)
+    column70544 = s.monthly_gross_deduction,
+    column70360 = s.monthly_gross_deduction,
+    column70579 = s.earned_gross_salary,
+    column70578 = s.earned_gross_salary,
+    column71128 = s.monthly_contribution,
+    column71129 = s.monthly_contribution,
+    column8575 = s.earned_gross_salary - s.monthly_gross_deduction
+    from (select * from table4107 AS B where b.column67397=$2 and b.column70293<=to_date($3, 'yyyy-mm-dd') and (b.column70294 is null or b.column70294>=to_date($4, 'yyyy-mm-dd')) limit 1) as b,
+    (select
+        (select COALESCE(sum(column70529),0) from table4276 where column70530=$1) as monthly_gross_deduction,
+        (select COALESCE(sum(column70372),0) from table4270 where column70384=$1) as earned_gross_salary,
+        (select COALESCE(sum(column70642),0) from table4280 where column70643=$1) as monthly_contribution) as s
+    where a.id=$1"""
+    # Declare the id and the lookup key with their columns' real types so
+    # they compare the way the old inlined literals did; the dates stay text
+    # because to_date takes text
+    types = plpy.execute("""
+select
+    (select format_type(atttypid, atttypmod) from pg_attribute
+        where attrelid = 'table545'::regclass and attname = 'id') as id_type,
+    (select format_type(atttypid, atttypmod) from pg_attribute
+        where attrelid = 'table4107'::regclass and attname = 'column67397') as key_type""")[0]
+    plan = plpy.prepare(query, [types["id_type"], types["key_type"], "text", "text"])
+    SD["update_salary_plan"] = plan
+
+plpy.execute(plan, [TD["new"]["id"], TD["new"]["column8493"], TD["new"]["column8522"], TD["new"]["column8523"]])
 plpy.notice(str(TD["new"]))
 return 'OK'
-$function$
\ No newline at end of file
+$function$
@@ -3,21 +3,28 @@
 import time
 from datetime import datetime
 
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 
-from ..core.engine import SearchEngine
-from ..models.response import HealthResponse, ErrorResponse
+from ..engine_instance import search_engine
+from ..models.response import HealthResponse
 from ..config import get_settings
 
 router = APIRouter(prefix="/api/v1", tags=["health"])
 settings = get_settings()
 
-# Import the global search engine instance
-from ..engine_instance import search_engine
-
-# Track application start time
+# Track application start time (wall clock for display, monotonic for
+# uptime so clock adjustments never make it jump or go negative)
 app_start_time = time.time()
+app_start_monotonic = time.monotonic()
+
+
+def _uptime() -> float:
+    """Seconds since the application started."""
+    return time.monotonic() - app_start_monotonic
+
+# Dependency statuses from least to most severe
+STATUS_SEVERITY = ("healthy", "degraded", "unhealthy")
 
 
 @router.get(
@@ -26,16 +33,22 @@ app_start_time = time.time()
     summary="Health check",
     description="Check the health status of the search engine service"
 )
-async def health_check() -> HealthResponse:
+async def health_check(
+    deep: bool = Query(
+        False,
+        description="Also run a smoke search through the engine"
+    )
+) -> HealthResponse:
     """
     Perform a health check on the search engine service.
     
     This endpoint checks the overall health of the service including
-    dependencies and core functionality.
+    dependencies and core functionality. Probes only check that the engine
+    is ready; ``deep=true`` additionally runs a real search.
     """
     try:
         # Calculate uptime
-        uptime = time.time() - app_start_time
+        uptime = _uptime()
         
         # Check core functionality
         dependencies = {
@@ -45,21 +58,19 @@ async def health_check() -> HealthResponse:
         }
         
         # Test basic functionality
-        try:
-            # Test search engine
-            test_result = search_engine.search("test", max_results=1)
-            if test_result is None:
-                dependencies["search_engine"] = "degraded"
-        except Exception:
+        if not search_engine.is_ready:
             dependencies["search_engine"] = "unhealthy"
+        elif deep:
+            try:
+                # Test search engine
+                test_result = search_engine.search("test", max_results=1)
+                if test_result is None:
+                    dependencies["search_engine"] = "degraded"
+            except Exception:
+                dependencies["search_engine"] = "unhealthy"
         
-        # Determine overall status
-        if all(status == "healthy" for status in dependencies.values()):
-            status = "healthy"
-        elif any(status == "unhealthy" for status in dependencies.values()):
-            status = "unhealthy"
-        else:
-            status = "degraded"
+        # Overall status is the most severe dependency status
+        status = max(dependencies.values(), key=STATUS_SEVERITY.index)
         
         return HealthResponse(
             status=status,
@@ -80,7 +91,7 @@ async def health_check() -> HealthResponse:
     summary="Readiness check",
     description="Check if the service is ready to accept requests"
 )
-async def readiness_check() -> JSONResponse:
+async def readiness_check() -> ORJSONResponse:
     """
     Check if the service is ready to accept requests.
     
@@ -88,11 +99,22 @@ async def readiness_check() -> JSONResponse:
     to determine if the service is ready to handle traffic.
     """
     try:
-        # Check if search engine is initialized and functional
+        # Not ready until mappings are loaded; the empty engine can still
+        # report stats
+        if not search_engine.is_ready:
+            return ORJSONResponse(
+                status_code=503,
+                content={
+                    "status": "not_ready",
+                    "error": "Mappings not loaded",
+                    "timestamp": datetime.utcnow().isoformat()
+                }
+            )
+        
         stats = search_engine.get_stats()
         
         # Service is ready if we can get stats
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "status": "ready",
@@ -102,7 +124,7 @@ async def readiness_check() -> JSONResponse:
         )
         
     except Exception as e:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=503,
             content={
                 "status": "not_ready",
@@ -117,7 +139,7 @@ async def readiness_check() -> JSONResponse:
     summary="Liveness check",
     description="Check if the service is alive and responding"
 )
-async def liveness_check() -> JSONResponse:
+async def liveness_check() -> ORJSONResponse:
     """
     Check if the service is alive and responding.
     
@@ -126,17 +148,17 @@ async def liveness_check() -> JSONResponse:
     """
     try:
         # Simple liveness check - just return current time
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "status": "alive",
                 "timestamp": datetime.utcnow().isoformat(),
-                "uptime": time.time() - app_start_time
+                "uptime": _uptime()
             }
         )
         
     except Exception as e:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "status": "dead",
@@ -151,7 +173,7 @@ async def liveness_check() -> JSONResponse:
     summary="Service status",
     description="Get detailed status information about the service"
 )
-async def service_status() -> JSONResponse:
+async def service_status() -> ORJSONResponse:
     """
     Get detailed status information about the service.
     
@@ -171,14 +193,14 @@ async def service_status() -> JSONResponse:
             "debug": settings.debug
         }
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "service": {
                     "name": settings.app_name,
                     "version": settings.app_version,
                     "status": "running",
-                    "uptime": time.time() - app_start_time,
+                    "uptime": _uptime(),
                     "start_time": datetime.fromtimestamp(app_start_time).isoformat()
                 },
                 "configuration": config_info,
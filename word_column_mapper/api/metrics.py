@@ -1,20 +1,78 @@
 """Metrics and monitoring API endpoints."""
 
-import psutil
+import time
 from datetime import datetime
+from typing import Tuple
+
+import psutil
 
 from fastapi import APIRouter, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
-from ..core.engine import SearchEngine
-from ..models.response import MetricsResponse, ErrorResponse
-from ..config import get_settings
+from ..engine_instance import search_engine
+from ..models.response import MetricsResponse
 
 router = APIRouter(prefix="/api/v1", tags=["metrics"])
-settings = get_settings()
 
-# Import the global search engine instance
-from ..engine_instance import search_engine
+# Seconds a system resource sample is reused across metrics requests
+SYSTEM_SAMPLE_TTL = 1.0
+
+_system_sample = {
+    "taken_at": float("-inf"),
+    "memory": None,
+    "cpu_percent": 0.0,
+    "process_rss": 0
+}
+
+# This service's own process, for per-process memory usage
+_process = psutil.Process()
+
+# Recommendations for the first average response time threshold (ms)
+# exceeded, checked from the slowest bracket down
+PERFORMANCE_RECOMMENDATIONS = (
+    (50.0, (
+        "Consider implementing caching for frequently accessed data",
+        "Review fuzzy matching algorithms for optimization opportunities",
+        "Consider using more efficient data structures"
+    )),
+    (10.0, (
+        "Consider implementing result caching",
+        "Monitor memory usage and optimize if needed"
+    )),
+    (5.0, (
+        "Performance is good, consider monitoring for trends",
+    ))
+)
+DEFAULT_PERFORMANCE_RECOMMENDATIONS = (
+    "Excellent performance! Consider documenting best practices",
+)
+
+# Prime the CPU counter so later non-blocking calls measure from here
+psutil.cpu_percent(interval=None)
+
+
+def _get_system_sample() -> Tuple[object, float, int]:
+    """
+    Get memory usage and CPU percentage, sampling at most once per TTL.
+    
+    ``cpu_percent(interval=None)`` reports usage since the previous call
+    instead of sleeping, so scrapes never block the event loop.
+    
+    Returns:
+        Tuple of (psutil virtual memory info, CPU usage percent,
+        resident memory of this process in bytes)
+    """
+    now = time.monotonic()
+    if now - _system_sample["taken_at"] >= SYSTEM_SAMPLE_TTL:
+        _system_sample["memory"] = psutil.virtual_memory()
+        _system_sample["cpu_percent"] = psutil.cpu_percent(interval=None)
+        _system_sample["process_rss"] = _process.memory_info().rss
+        _system_sample["taken_at"] = now
+    return (
+        _system_sample["memory"],
+        _system_sample["cpu_percent"],
+        _system_sample["process_rss"]
+    )
 
 
 @router.get(
@@ -34,24 +92,16 @@ async def get_metrics() -> MetricsResponse:
         # Get engine statistics
         stats = search_engine.get_stats()
         
-        # Get system memory usage
-        memory_info = psutil.virtual_memory()
-        memory_usage_mb = memory_info.used / (1024 * 1024)  # Convert to MB
+        # Get this process's memory usage
+        _, _, process_rss = _get_system_sample()
+        memory_usage_mb = process_rss / (1024 * 1024)  # Convert to MB
         
         # Calculate metrics
         total_queries = stats.get("total_queries", 0)
-        total_execution_time = stats.get("total_execution_time", 0.0)
-        exact_matches = stats.get("exact_matches", 0)
-        fuzzy_matches = stats.get("fuzzy_matches", 0)
-        no_matches = stats.get("no_matches", 0)
         
-        # Calculate rates
-        if total_queries > 0:
-            average_response_time_ms = total_execution_time / total_queries
-            error_rate = 0.0  # We don't track errors separately yet
-        else:
-            average_response_time_ms = 0.0
-            error_rate = 0.0
+        # Rates are already derived by get_stats (0.0 before any query)
+        average_response_time_ms = stats.get("average_execution_time_ms", 0.0)
+        error_rate = 0.0  # We don't track errors separately yet
         
         # Cache metrics (placeholder - will be implemented with Redis)
         cache_hit_rate = 0.0
@@ -80,7 +130,7 @@ async def get_metrics() -> MetricsResponse:
     summary="Get detailed metrics",
     description="Get detailed performance metrics including breakdown by operation type"
 )
-async def get_detailed_metrics() -> JSONResponse:
+async def get_detailed_metrics() -> ORJSONResponse:
     """
     Get detailed performance metrics including breakdown by operation type.
     
@@ -92,29 +142,23 @@ async def get_detailed_metrics() -> JSONResponse:
         stats = search_engine.get_stats()
         
         # Get system information
-        memory_info = psutil.virtual_memory()
-        cpu_info = psutil.cpu_percent(interval=1)
+        memory_info, cpu_info, process_rss = _get_system_sample()
         
         # Calculate detailed metrics
         total_queries = stats.get("total_queries", 0)
         
-        if total_queries > 0:
-            exact_match_rate = stats.get("exact_match_rate", 0.0)
-            fuzzy_match_rate = stats.get("fuzzy_match_rate", 0.0)
-            no_match_rate = stats.get("no_match_rate", 0.0)
-            average_response_time = stats.get("average_execution_time_ms", 0.0)
-        else:
-            exact_match_rate = 0.0
-            fuzzy_match_rate = 0.0
-            no_match_rate = 0.0
-            average_response_time = 0.0
+        # get_stats reports 0.0 rates before any query has run
+        exact_match_rate = stats.get("exact_match_rate", 0.0)
+        fuzzy_match_rate = stats.get("fuzzy_match_rate", 0.0)
+        no_match_rate = stats.get("no_match_rate", 0.0)
+        average_response_time = stats.get("average_execution_time_ms", 0.0)
         
         # Index statistics
         index_stats = stats.get("index_stats", {})
         forward_stats = index_stats.get("forward_index", {})
         reverse_stats = index_stats.get("reverse_index", {})
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "query_metrics": {
@@ -135,7 +179,8 @@ async def get_detailed_metrics() -> JSONResponse:
                     "unique_columns": index_stats.get("total_unique_columns", 0)
                 },
                 "system_metrics": {
-                    "memory_usage_mb": memory_info.used / (1024 * 1024),
+                    "memory_usage_mb": process_rss / (1024 * 1024),
+                    "host_memory_used_mb": memory_info.used / (1024 * 1024),
                     "memory_usage_percent": memory_info.percent,
                     "cpu_usage_percent": cpu_info,
                     "available_memory_mb": memory_info.available / (1024 * 1024)
@@ -161,7 +206,7 @@ async def get_detailed_metrics() -> JSONResponse:
     summary="Get performance benchmarks",
     description="Get performance benchmark results for different query types"
 )
-async def get_performance_benchmarks() -> JSONResponse:
+async def get_performance_benchmarks() -> ORJSONResponse:
     """
     Get performance benchmark results for different query types.
     
@@ -176,9 +221,9 @@ async def get_performance_benchmarks() -> JSONResponse:
         total_queries = stats.get("total_queries", 0)
         total_execution_time = stats.get("total_execution_time", 0.0)
         
+        average_response_time = stats.get("average_execution_time_ms", 0.0)
+        
         if total_queries > 0:
-            average_response_time = total_execution_time / total_queries
-            
             # Performance targets from documentation
             performance_targets = {
                 "exact_match_target_ms": 1.0,
@@ -194,7 +239,6 @@ async def get_performance_benchmarks() -> JSONResponse:
                 "overall_performance": "good" if average_response_time < 5.0 else "needs_improvement"
             }
         else:
-            average_response_time = 0.0
             performance_targets = {}
             performance_status = {
                 "exact_match_performance": "no_data",
@@ -202,7 +246,7 @@ async def get_performance_benchmarks() -> JSONResponse:
                 "overall_performance": "no_data"
             }
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "current_performance": {
@@ -224,20 +268,10 @@ async def get_performance_benchmarks() -> JSONResponse:
         )
 
 
-def _get_performance_recommendations(average_response_time: float) -> list[str]:
+def _get_performance_recommendations(average_response_time: float) -> Tuple[str, ...]:
     """Get performance recommendations based on current metrics."""
-    recommendations = []
-    
-    if average_response_time > 50.0:
-        recommendations.append("Consider implementing caching for frequently accessed data")
-        recommendations.append("Review fuzzy matching algorithms for optimization opportunities")
-        recommendations.append("Consider using more efficient data structures")
-    elif average_response_time > 10.0:
-        recommendations.append("Consider implementing result caching")
-        recommendations.append("Monitor memory usage and optimize if needed")
-    elif average_response_time > 5.0:
-        recommendations.append("Performance is good, consider monitoring for trends")
-    else:
-        recommendations.append("Excellent performance! Consider documenting best practices")
+    for threshold_ms, recommendations in PERFORMANCE_RECOMMENDATIONS:
+        if average_response_time > threshold_ms:
+            return recommendations
     
-    return recommendations
+    return DEFAULT_PERFORMANCE_RECOMMENDATIONS
@@ -1,22 +1,29 @@
 """Set operations API endpoints."""
 
+import asyncio
 import os
-import subprocess
 import json
+import re
 import time
-from typing import List
+import orjson
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from dotenv import load_dotenv
 
 from fastapi import APIRouter, HTTPException, Query
-from fastapi.responses import JSONResponse
-from anthropic import Anthropic
+from fastapi.responses import ORJSONResponse
+from starlette.concurrency import run_in_threadpool
+from anthropic import AsyncAnthropic
 
 from ..core.engine import SearchEngine
 from ..models.response import SetOperationResponse, ErrorResponse
-from ..models.request import SetOperationRequest
+from ..models.request import (
+    BatchSetOperationRequest, NaturalLanguageQueryRequest, SetOperationRequest
+)
 from ..config import get_settings
 from ..table_frequency_ranker import TableFrequencyRanker
 from ..table_relationship_traversal import TableRelationshipTraversal
+from .. import csv_to_json
 
 # Load environment variables
 load_dotenv()
@@ -35,6 +42,114 @@ base_dir = os.path.dirname(os.path.dirname(__file__))
 schema_file = os.path.join(base_dir, "form_table_schema.json")
 table_traversal = TableRelationshipTraversal(schema_file, debug=True)  # Enable debug
 
+# Column -> table mapping, parsed on first use and replaced when
+# recreate_mappings regenerates the file
+column_table_mapping_file = os.path.join(base_dir, "column_table_mapping.json")
+_column_table_mapping: Optional[Dict[str, str]] = None
+
+
+def _load_column_table_mapping() -> Optional[Dict[str, str]]:
+    """
+    Get the column -> table mapping, reading the file only once.
+    
+    Returns:
+        The parsed mapping (shared, do not mutate) or None if the file does not exist
+    """
+    global _column_table_mapping
+    if _column_table_mapping is None and os.path.exists(column_table_mapping_file):
+        with open(column_table_mapping_file, 'rb') as f:
+            _column_table_mapping = orjson.loads(f.read())
+    return _column_table_mapping
+
+
+# Claude client shared by all requests so its connection pool is reused;
+# rebuilt when ANTHROPIC_API_KEY changes
+_anthropic_client: Optional[AsyncAnthropic] = None
+
+
+def _get_anthropic_client(api_key: str) -> AsyncAnthropic:
+    """
+    Get the shared Claude client for an API key.
+    
+    Args:
+        api_key: Anthropic API key
+        
+    Returns:
+        The cached client, or a new one if none exists yet or the key changed
+    """
+    global _anthropic_client
+    if _anthropic_client is None or _anthropic_client.api_key != api_key:
+        _anthropic_client = AsyncAnthropic(api_key=api_key)
+    return _anthropic_client
+
+
+# One keyword in a reply that is not valid JSON: a double or single quoted
+# string, or an unquoted run up to the next comma or bracket
+_KEYWORD_TOKEN = re.compile(r'"([^"]*)"|\'([^\']*)\'|([^,\[\]"\'\s][^,\[\]"]*)')
+
+# Number of natural language queries whose extracted keywords are kept
+KEYWORD_CACHE_SIZE = 1024
+
+# query -> (expiry time, keywords), least recently used first; handlers run
+# on the event loop thread, so no lock is needed
+_keyword_cache: "OrderedDict[str, Tuple[float, List[str]]]" = OrderedDict()
+
+
+def _get_cached_keywords(query: str) -> Optional[List[str]]:
+    """
+    Get the keywords previously extracted for a query.
+    
+    Args:
+        query: Natural language query
+        
+    Returns:
+        A copy of the cached keywords, or None if caching is disabled or the entry is missing or expired
+    """
+    if not settings.enable_cache:
+        return None
+    
+    entry = _keyword_cache.get(query)
+    if entry is None:
+        return None
+    
+    expires_at, keywords = entry
+    if time.monotonic() >= expires_at:
+        del _keyword_cache[query]
+        return None
+    
+    _keyword_cache.move_to_end(query)
+    return list(keywords)
+
+
+def _cache_keywords(query: str, keywords: List[str]) -> None:
+    """
+    Remember the keywords extracted for a query for ``settings.cache_ttl`` seconds.
+    
+    Args:
+        query: Natural language query
+        keywords: Keywords Claude returned for it
+    """
+    if not settings.enable_cache:
+        return
+    
+    _keyword_cache[query] = (time.monotonic() + settings.cache_ttl, list(keywords))
+    _keyword_cache.move_to_end(query)
+    while len(_keyword_cache) > KEYWORD_CACHE_SIZE:
+        _keyword_cache.popitem(last=False)
+
+
+def _normalize_words(words: List[str]) -> List[str]:
+    """
+    Strip and deduplicate the words of a query-string set operation.
+    
+    Args:
+        words: Words as received in the request
+        
+    Returns:
+        Distinct non-empty words in the order they were first given
+    """
+    return list(dict.fromkeys(word for word in map(str.strip, words) if word))
+
 
 @router.get(
     "/intersection",
@@ -59,8 +174,7 @@ async def intersection_search(
                 detail="At least 2 words are required for intersection operation"
             )
         
-        # Remove duplicates and empty strings
-        words = list(set(word.strip() for word in words if word.strip()))
+        words = _normalize_words(words)
         
         if len(words) < 2:
             raise HTTPException(
@@ -114,8 +228,7 @@ async def union_search(
                 detail="At least 1 word is required for union operation"
             )
         
-        # Remove duplicates and empty strings
-        words = list(set(word.strip() for word in words if word.strip()))
+        words = _normalize_words(words)
         
         if not words:
             raise HTTPException(
@@ -160,43 +273,7 @@ async def set_operation(request: SetOperationRequest) -> SetOperationResponse:
     intersection or union operations on a set of words.
     """
     try:
-        # Determine operation type
-        if request.operation in ["intersection", "and"]:
-            result = search_engine.intersection_search(request.words)
-            operation = "AND"
-        elif request.operation in ["union", "or"]:
-            result = search_engine.union_search(request.words)
-            operation = "OR"
-        else:
-            raise HTTPException(
-                status_code=400,
-                detail="Operation must be 'intersection', 'union', 'and', or 'or'"
-            )
-        
-        if result is None:
-            # Return empty result based on operation type
-            if operation == "AND":
-                return SetOperationResponse(
-                    query_words=request.words,
-                    operation=operation,
-                    intersection_columns=[],
-                    total_common_columns=0,
-                    execution_time_ms=0.0,
-                    note="No common columns found"
-                )
-            else:
-                return SetOperationResponse(
-                    query_words=request.words,
-                    operation=operation,
-                    union_columns=[],
-                    total_unique_columns=0,
-                    execution_time_ms=0.0,
-                    note="No columns found for any of the specified words"
-                )
-        
-        # Update operation field
-        result["operation"] = operation
-        return SetOperationResponse(**result)
+        return _run_set_operation(request)
         
     except HTTPException:
         raise
@@ -207,12 +284,87 @@ async def set_operation(request: SetOperationRequest) -> SetOperationResponse:
         )
 
 
+@router.post(
+    "/operations/batch",
+    response_model=List[SetOperationResponse],
+    summary="Batch set operations",
+    description="Perform several intersection or union operations in a single request"
+)
+async def batch_set_operation(request: BatchSetOperationRequest) -> List[SetOperationResponse]:
+    """
+    Perform several set operations in a single request.
+    
+    Results are returned in the same order as the requested operations.
+    """
+    try:
+        return [_run_set_operation(operation) for operation in request.operations]
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Batch set operation failed: {str(e)}"
+        )
+
+
+def _run_set_operation(request: SetOperationRequest) -> SetOperationResponse:
+    """
+    Run one intersection or union request against the search engine.
+    
+    Args:
+        request: Validated set operation request
+        
+    Returns:
+        Set operation response, empty when no columns match
+    """
+    words = request.words
+    
+    # Determine operation type
+    if request.operation in ["intersection", "and"]:
+        result = search_engine.intersection_search(words)
+        operation = "AND"
+    elif request.operation in ["union", "or"]:
+        result = search_engine.union_search(words)
+        operation = "OR"
+    else:
+        raise HTTPException(
+            status_code=400,
+            detail="Operation must be 'intersection', 'union', 'and', or 'or'"
+        )
+    
+    if result is None:
+        # Return empty result based on operation type
+        if operation == "AND":
+            return SetOperationResponse(
+                query_words=words,
+                operation=operation,
+                intersection_columns=[],
+                total_common_columns=0,
+                execution_time_ms=0.0,
+                note="No common columns found"
+            )
+        else:
+            return SetOperationResponse(
+                query_words=words,
+                operation=operation,
+                union_columns=[],
+                total_unique_columns=0,
+                execution_time_ms=0.0,
+                note="No columns found for any of the specified words"
+            )
+    
+    # Update operation field
+    result["operation"] = operation
+    return SetOperationResponse(**result)
+
+
 @router.get(
     "/operations/stats",
     summary="Get operation statistics",
     description="Get statistics about set operations performed"
 )
-async def get_operation_stats() -> JSONResponse:
+async def get_operation_stats() -> ORJSONResponse:
     """
     Get statistics about set operations.
     
@@ -222,7 +374,7 @@ async def get_operation_stats() -> JSONResponse:
     try:
         stats = search_engine.get_stats()
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "total_queries": stats["total_queries"],
@@ -243,22 +395,125 @@ async def get_operation_stats() -> JSONResponse:
         )
 
 
+async def _run_mapping_step(
+    name: str, func: Callable[[], Any], timeout: float
+) -> Tuple[Dict[str, object], Any, Optional[asyncio.Future]]:
+    """
+    Run one recreate-mappings step on a worker thread.
+    
+    Args:
+        name: Step name reported in the response
+        func: The step's entry point
+        timeout: Seconds to wait for the step before giving up on it
+        
+    Returns:
+        Tuple of (step entry for the response, value returned by func or None
+        on failure, the step's future if it timed out and is still running)
+    """
+    step_start = time.time()
+    work = asyncio.ensure_future(run_in_threadpool(func))
+    try:
+        # A worker thread cannot be killed, so a timeout only stops the wait;
+        # shield keeps the future alive so the caller can wait for the thread
+        value = await asyncio.wait_for(asyncio.shield(work), timeout=timeout)
+    except asyncio.TimeoutError:
+        return {
+            "step": name,
+            "status": "timeout",
+            "time_ms": timeout * 1000,
+            "error": f"Step timed out after {timeout} seconds"
+        }, None, work
+    except Exception as e:
+        return {
+            "step": name,
+            "status": "error",
+            "time_ms": round((time.time() - step_start) * 1000, 2),
+            "error": str(e)
+        }, None, None
+    
+    return {
+        "step": name,
+        "status": "success",
+        "time_ms": round((time.time() - step_start) * 1000, 2)
+    }, value, None
+
+
+def _dump_column_names() -> int:
+    """Run get_all_column_names.py, importing it (and psycopg2) only when called."""
+    from .. import get_all_column_names
+    return get_all_column_names.main()
+
+
+def _release_when_done(work: asyncio.Future) -> None:
+    """Release _recreate_lock once a timed-out step's thread has finished."""
+    def release(done: asyncio.Future) -> None:
+        if not done.cancelled():
+            done.exception()  # Mark any late error as retrieved
+        _recreate_lock.release()
+    
+    work.add_done_callback(release)
+
+
+# Seconds recreate_mappings waits for each step
+COLUMN_DUMP_TIMEOUT = 300
+CSV_TO_JSON_TIMEOUT = 60
+
+# Serializes recreate_mappings; _recreate_last holds when the latest run
+# finished with its status code and payload, for requests that waited on
+# that run (each gets its own response object)
+_recreate_lock = asyncio.Lock()
+_recreate_last: Optional[Tuple[float, int, Dict[str, Any]]] = None
+
+
 @router.post(
     "/recreate-mappings",
     summary="Recreate mappings from database",
     description="Run the complete process to recreate mappings: get_all_column_names.py -> csv_to_json.py -> reload engine"
 )
-async def recreate_mappings() -> JSONResponse:
+async def recreate_mappings() -> ORJSONResponse:
     """
     Recreate mappings by running the complete process:
     1. Run get_all_column_names.py to generate column names from database
     2. Run csv_to_json.py to create mappings JSON
     3. Reload the search engine with new mappings
+    
+    Only one recreation runs at a time. A request that arrives while one is
+    running waits for it and gets its response instead of starting another.
     """
+    global _recreate_last
+    
+    requested_at = time.monotonic()
+    await _recreate_lock.acquire()
+    unfinished = None
     try:
-        # Get the base directory (word_column_mapper directory)
-        base_dir = os.path.dirname(os.path.dirname(__file__))
+        if _recreate_last is not None and _recreate_last[0] >= requested_at:
+            _, status_code, results = _recreate_last
+        else:
+            status_code, results, unfinished = await _recreate_mappings()
+            _recreate_last = (time.monotonic(), status_code, results)
         
+        return ORJSONResponse(status_code=status_code, content=results)
+    finally:
+        # A timed-out step may still be writing the mapping files; the next
+        # run must not start until its thread is done
+        if unfinished is None:
+            _recreate_lock.release()
+        else:
+            _release_when_done(unfinished)
+
+
+async def _recreate_mappings() -> Tuple[int, Dict[str, Any], Optional[asyncio.Future]]:
+    """
+    Run the recreate-mappings steps and collect the endpoint's payload.
+    
+    Returns:
+        Tuple of (status code, response payload, future of a timed-out step
+        that is still running)
+    """
+    global _column_table_mapping
+    
+    unfinished = None
+    try:
         results = {
             "status": "success",
             "steps": [],
@@ -268,113 +523,30 @@ async def recreate_mappings() -> JSONResponse:
         
         start_time = time.time()
         
-        # Step 1: Run get_all_column_names.py
-        step1_start = time.time()
-        try:
-            get_columns_script = os.path.join(base_dir, "get_all_column_names.py")
-            result = subprocess.run(
-                ["python", get_columns_script],
-                cwd=base_dir,
-                capture_output=True,
-                text=True,
-                timeout=300  # 5 minute timeout
-            )
-            
-            step1_time = (time.time() - step1_start) * 1000
-            
-            if result.returncode == 0:
-                results["steps"].append({
-                    "step": "get_all_column_names.py",
-                    "status": "success",
-                    "time_ms": round(step1_time, 2),
-                    "output": result.stdout.strip()
-                })
-            else:
-                results["steps"].append({
-                    "step": "get_all_column_names.py",
-                    "status": "error",
-                    "time_ms": round(step1_time, 2),
-                    "error": result.stderr.strip()
-                })
-                raise Exception(f"get_all_column_names.py failed: {result.stderr}")
-                
-        except subprocess.TimeoutExpired:
-            results["steps"].append({
-                "step": "get_all_column_names.py",
-                "status": "timeout",
-                "time_ms": 300000,
-                "error": "Process timed out after 5 minutes"
-            })
-            raise Exception("get_all_column_names.py timed out")
-        except Exception as e:
-            results["steps"].append({
-                "step": "get_all_column_names.py",
-                "status": "error",
-                "time_ms": round((time.time() - step1_start) * 1000, 2),
-                "error": str(e)
-            })
-            raise
+        # Step 1: Regenerate form_table_columns.csv from the database
+        step, rows_written, unfinished = await _run_mapping_step(
+            "get_all_column_names.py", _dump_column_names, timeout=COLUMN_DUMP_TIMEOUT
+        )
+        if step["status"] == "success":
+            step["rows_written"] = rows_written
+        results["steps"].append(step)
+        if step["status"] != "success":
+            raise Exception(f"get_all_column_names.py failed: {step['error']}")
         
-        # Step 2: Run csv_to_json.py
-        step2_start = time.time()
-        try:
-            csv_to_json_script = os.path.join(base_dir, "csv_to_json.py")
-            result = subprocess.run(
-                ["python", csv_to_json_script],
-                cwd=base_dir,
-                capture_output=True,
-                text=True,
-                timeout=60  # 1 minute timeout
-            )
-            
-            step2_time = (time.time() - step2_start) * 1000
-            
-            if result.returncode == 0:
-                results["steps"].append({
-                    "step": "csv_to_json.py",
-                    "status": "success",
-                    "time_ms": round(step2_time, 2),
-                    "output": result.stdout.strip()
-                })
-            else:
-                results["steps"].append({
-                    "step": "csv_to_json.py",
-                    "status": "error",
-                    "time_ms": round(step2_time, 2),
-                    "error": result.stderr.strip()
-                })
-                raise Exception(f"csv_to_json.py failed: {result.stderr}")
-                
-        except subprocess.TimeoutExpired:
-            results["steps"].append({
-                "step": "csv_to_json.py",
-                "status": "timeout",
-                "time_ms": 60000,
-                "error": "Process timed out after 1 minute"
-            })
-            raise Exception("csv_to_json.py timed out")
-        except Exception as e:
-            results["steps"].append({
-                "step": "csv_to_json.py",
-                "status": "error",
-                "time_ms": round((time.time() - step2_start) * 1000, 2),
-                "error": str(e)
-            })
-            raise
+        # Step 2: Build both mapping files from the CSV
+        step, mapping_files, unfinished = await _run_mapping_step(
+            "csv_to_json.py", csv_to_json.main, timeout=CSV_TO_JSON_TIMEOUT
+        )
+        results["steps"].append(step)
+        if step["status"] != "success":
+            raise Exception(f"csv_to_json.py failed: {step['error']}")
+        
+        # The step returns what it wrote, so nothing needs to be read back
+        new_mappings, _column_table_mapping = mapping_files
         
         # Step 3: Reload the search engine with new mappings
         step3_start = time.time()
         try:
-            mappings_file = os.path.join(base_dir, "sample_mappings2.json")
-            
-            if not os.path.exists(mappings_file):
-                raise Exception("sample_mappings2.json not found after csv_to_json.py")
-            
-            # Load the new mappings
-            with open(mappings_file, 'r', encoding='utf-8') as f:
-                new_mappings = json.load(f)
-            
-            # Reload the search engine
             search_engine.load_mappings(new_mappings)
             
             step3_time = (time.time() - step3_start) * 1000
@@ -399,10 +571,7 @@ async def recreate_mappings() -> JSONResponse:
         # Calculate total time
         results["total_time_ms"] = round((time.time() - start_time) * 1000, 2)
         
-        return JSONResponse(
-            status_code=200,
-            content=results
-        )
+        return 200, results, None
         
     except Exception as e:
         # Calculate total time even on error
@@ -412,10 +581,7 @@ async def recreate_mappings() -> JSONResponse:
         results["status"] = "error"
         results["error"] = str(e)
         
-        return JSONResponse(
-            status_code=500,
-            content=results
-        )
+        return 500, results, unfinished
 
 
 @router.post(
@@ -423,7 +589,7 @@ async def recreate_mappings() -> JSONResponse:
     summary="Get table names from column IDs",
     description="Get array of table names for given column IDs using column_table_mapping.json"
 )
-async def get_table_names(column_ids: List[str]) -> JSONResponse:
+async def get_table_names(column_ids: List[str]) -> ORJSONResponse:
     """
     Get table names for given column IDs.
     
@@ -431,17 +597,12 @@ async def get_table_names(column_ids: List[str]) -> JSONResponse:
     from the column_table_mapping.json file.
     """
     try:
-        # Get the base directory (word_column_mapper directory)
-        base_dir = os.path.dirname(os.path.dirname(__file__))
-        mapping_file = os.path.join(base_dir, "column_table_mapping.json")
+        # Load the column to table mapping
+        column_table_mapping = _load_column_table_mapping()
         
-        if not os.path.exists(mapping_file):
+        if column_table_mapping is None:
             raise Exception("column_table_mapping.json not found")
         
-        # Load the column to table mapping
-        with open(mapping_file, 'r', encoding='utf-8') as f:
-            column_table_mapping = json.load(f)
-        
         # Get table names for the provided column IDs (including duplicates)
         table_names = []
         found_columns = []
@@ -456,9 +617,9 @@ async def get_table_names(column_ids: List[str]) -> JSONResponse:
                 not_found_columns.append(column_id)
         
         # Get unique table names for counting
-        unique_table_names = sorted(list(set(table_names)))
+        unique_table_names = sorted(set(table_names))
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "status": "success",
@@ -476,7 +637,7 @@ async def get_table_names(column_ids: List[str]) -> JSONResponse:
         )
         
     except Exception as e:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "status": "error",
@@ -492,7 +653,7 @@ async def get_table_names(column_ids: List[str]) -> JSONResponse:
     summary="Process natural language query to get columns and tables",
     description="Convert natural language query to relevant words using Claude AI, then get columns and tables for each word"
 )
-async def process_natural_language_query(request: dict) -> JSONResponse:
+async def process_natural_language_query(request: NaturalLanguageQueryRequest) -> ORJSONResponse:
     """
     Process natural language query through Claude AI to extract relevant words,
     then search for columns and tables for each word.
@@ -500,11 +661,10 @@ async def process_natural_language_query(request: dict) -> JSONResponse:
     Flow: Natural Language Query → Claude → Relevant Words → Search Engine → Columns → Tables
     """
     try:
-        # Extract query from request
-        query = request.get('query', '').strip()
+        query = request.query
         
         if not query:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=400,
                 content={"status": "error", "error": "Query is required"}
             )
@@ -514,7 +674,7 @@ async def process_natural_language_query(request: dict) -> JSONResponse:
         
         # Validate API key
         if not anthropic_api_key:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=500,
                 content={
                     "status": "error", 
@@ -542,46 +702,63 @@ Output: ["employee", "employees", "emp", "staff", "worker", "salary", "sal", "wa
 Now extract keywords from the query above and return only the JSON array:
             """
         
-        print(claude_prompt)
-        
         claude_start = time.time()
-        try:
-            # Initialize Anthropic client
-            client = Anthropic(api_key=anthropic_api_key)
+        # Identical queries reuse the keywords Claude already extracted
+        relevant_words = _get_cached_keywords(query)
+        keywords_cache_hit = relevant_words is not None
+        if not keywords_cache_hit:
+            try:
+                # The async client keeps the event loop free for other
+                # requests during the API round trip
+                client = _get_anthropic_client(anthropic_api_key)
             
-            response = client.messages.create(
-                model="claude-3-5-sonnet-20241022",
-                max_tokens=250,
-                temperature=0.2,
-                system="You are a PostgreSQL database expert. Extract relevant nouns and noun phrases from natural language queries. Always return valid JSON arrays.",
-                messages=[
-                    {"role": "user", "content": claude_prompt}
-                ]
-            )
+                response = await client.messages.create(
+                    model="claude-3-5-sonnet-20241022",
+                    max_tokens=250,
+                    temperature=0.2,
+                    system="You are a PostgreSQL database expert. Extract relevant nouns and noun phrases from natural language queries. Always return valid JSON arrays.",
+                    messages=[
+                        {"role": "user", "content": claude_prompt}
+                    ]
+                )
             
-            relevant_words_text = response.content[0].text.strip()
+                relevant_words_text = response.content[0].text.strip()
+                
+                # Parse the JSON response
+                try:
+                    # orjson.JSONDecodeError subclasses json.JSONDecodeError
+                    relevant_words = orjson.loads(relevant_words_text)
+                    if not isinstance(relevant_words, list):
+                        raise ValueError("Response is not a list")
+                except (json.JSONDecodeError, ValueError):
+                    # Fallback: try to extract words from text in one regex pass
+                    relevant_words = []
+                    for match in _KEYWORD_TOKEN.finditer(relevant_words_text):
+                        word = next(filter(None, match.groups()), "").strip()
+                        if len(word) > 1:
+                            relevant_words.append(word)
             
-            claude_time = (time.time() - claude_start) * 1000
+            except Exception as e:
+                return ORJSONResponse(
+                    status_code=500,
+                    content={
+                        "status": "error",
+                        "error": f"Claude API error: {str(e)}",
+                        "step": "claude_extraction"
+                    }
+                )
             
-            # Parse the JSON response
-            try:
-                relevant_words = json.loads(relevant_words_text)
-                if not isinstance(relevant_words, list):
-                    raise ValueError("Response is not a list")
-            except (json.JSONDecodeError, ValueError) as e:
-                # Fallback: try to extract words from text
-                relevant_words = [word.strip().strip('"\'') for word in relevant_words_text.replace('[', '').replace(']', '').split(',')]
-                relevant_words = [word for word in relevant_words if word and len(word) > 1]
+            # Claude sometimes repeats a keyword with different casing or
+            # padding; search each one once, keeping its first spelling
+            unique_words: Dict[str, str] = {}
+            for word in relevant_words:
+                if isinstance(word, str) and word.strip():
+                    unique_words.setdefault(word.strip().casefold(), word.strip())
+            relevant_words = list(unique_words.values())
             
-        except Exception as e:
-            return JSONResponse(
-                status_code=500,
-                content={
-                    "status": "error",
-                    "error": f"Claude API error: {str(e)}",
-                    "step": "claude_extraction"
-                }
-            )
+            _cache_keywords(query, relevant_words)
+        
+        claude_time = (time.time() - claude_start) * 1000
         
         # Step 2: Process each word through search engine
         search_results = []
@@ -600,17 +777,14 @@ Now extract keywords from the query above and return only the JSON array:
                     table_start = time.time()
                     try:
                         # Get table names using the existing endpoint logic
-                        base_dir = os.path.dirname(os.path.dirname(__file__))
-                        mapping_file = os.path.join(base_dir, "column_table_mapping.json")
+                        column_table_mapping = _load_column_table_mapping()
                         
-                        if os.path.exists(mapping_file):
-                            with open(mapping_file, 'r', encoding='utf-8') as f:
-                                column_table_mapping = json.load(f)
-                            
-                            word_tables = []
-                            for column_id in search_result.total_all_columns:  # Use all columns including duplicates
-                                if column_id in column_table_mapping:
-                                    word_tables.append(column_table_mapping[column_id])  # Keep duplicate tables
+                        if column_table_mapping is not None:
+                            # Use all columns including duplicates and keep duplicate tables
+                            word_tables = [
+                                table for table in map(column_table_mapping.get, search_result.total_all_columns)
+                                if table is not None
+                            ]
                             
                             table_time = (time.time() - table_start) * 1000
                         else:
@@ -660,9 +834,9 @@ Now extract keywords from the query above and return only the JSON array:
         # all_columns = list(set(all_columns))  # Removed to keep duplicates
         # all_tables = list(set(all_tables))    # Removed to keep duplicates
         
-        # Also provide unique versions for comparison
-        unique_columns = list(set(all_columns))
-        unique_tables = list(set(all_tables))
+        # Also provide unique versions for comparison, in first-seen order
+        unique_columns = list(dict.fromkeys(all_columns))
+        unique_tables = list(dict.fromkeys(all_tables))
         
         # Step 3: Use TableFrequencyRanker to analyze table distribution
         ranking_start = time.time()
@@ -776,21 +950,22 @@ Now extract keywords from the query above and return only the JSON array:
                 "error": str(e),
                 "traversal_enabled": True,
                 "max_frequency": 0,
-                "original_tables": list(set(all_tables)) if all_tables else [],
+                "original_tables": unique_tables,
                 "related_tables": [],
-                "all_relevant_tables": list(set(all_tables)) if all_tables else [],
-                "total_original_tables": len(set(all_tables)) if all_tables else 0,
+                "all_relevant_tables": unique_tables,
+                "total_original_tables": len(unique_tables),
                 "total_related_tables": 0,
-                "total_relevant_tables": len(set(all_tables)) if all_tables else 0
+                "total_relevant_tables": len(unique_tables)
             }
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "status": "success",
                 "original_query": query,
                 "relevant_words": relevant_words,
                 "claude_time_ms": claude_time,
+                "keywords_cache_hit": keywords_cache_hit,
                 "search_results": search_results,
                 "table_ranking": table_analysis,
                 "ranking_time_ms": ranking_time,
@@ -809,7 +984,7 @@ Now extract keywords from the query above and return only the JSON array:
         )
         
     except Exception as e:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "status": "error",
@@ -824,7 +999,7 @@ Now extract keywords from the query above and return only the JSON array:
     summary="Analyze and rank tables by frequency and cross-keyword relevance",
     description="Analyze table distribution across search results and rank by cross-keyword relevance"
 )
-async def analyze_table_ranking(request: dict) -> JSONResponse:
+async def analyze_table_ranking(request: dict) -> ORJSONResponse:
     """
     Analyze and rank tables from search results.
     
@@ -849,7 +1024,7 @@ async def analyze_table_ranking(request: dict) -> JSONResponse:
         min_keywords = request.get('min_keywords', 1)
         
         if not search_results:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=400,
                 content={
                     "status": "error",
@@ -874,7 +1049,7 @@ async def analyze_table_ranking(request: dict) -> JSONResponse:
         
         execution_time = (time.time() - start_time) * 1000
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "status": "success",
@@ -884,7 +1059,7 @@ async def analyze_table_ranking(request: dict) -> JSONResponse:
         )
         
     except Exception as e:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "status": "error",
@@ -898,7 +1073,7 @@ async def analyze_table_ranking(request: dict) -> JSONResponse:
     summary="Get keyword coverage for a specific table",
     description="Get detailed information about which keywords map to a specific table"
 )
-async def get_table_coverage(table_name: str) -> JSONResponse:
+async def get_table_coverage(table_name: str) -> ORJSONResponse:
     """
     Get keyword coverage for a specific table.
     
@@ -908,7 +1083,7 @@ async def get_table_coverage(table_name: str) -> JSONResponse:
     try:
         # This endpoint requires context from a previous search
         # In a production system, you might want to store this in cache or session
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "status": "info",
@@ -917,7 +1092,7 @@ async def get_table_coverage(table_name: str) -> JSONResponse:
         )
         
     except Exception as e:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "status": "error",
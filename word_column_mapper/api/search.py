@@ -24,7 +24,12 @@ from ..engine_instance import search_engine
     description="Search for column identifiers that match a given word with fuzzy matching support"
 )
 async def search_word(
-    query: str = Path(..., description="The word to search for", min_length=1, max_length=100),
+    query: str = Path(
+        ...,
+        description="The word to search for",
+        min_length=1,
+        max_length=settings.max_query_length
+    ),
     fuzzy_threshold: Optional[float] = Query(
         None, 
         ge=0.0, 
@@ -49,14 +54,7 @@ async def search_word(
     Returns detailed results including confidence scores and match types.
     """
     try:
-        # Validate query length
-        if len(query) > settings.max_query_length:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Query too long. Maximum length is {settings.max_query_length} characters"
-            )
-        
-        # Perform search
+        # Query length is enforced by the path parameter validation (422)
         result = search_engine.search(
             query=query,
             fuzzy_threshold=fuzzy_threshold,
@@ -117,18 +115,12 @@ async def batch_search(request: BatchSearchRequest) -> list[SearchResponse]:
     which is more efficient than making multiple individual requests.
     """
     try:
-        results = []
-        
-        for query in request.queries:
-            result = search_engine.search(
-                query=query,
-                fuzzy_threshold=request.fuzzy_threshold,
-                max_results=request.max_results or settings.max_results,
-                include_suggestions=True
-            )
-            results.append(result)
-        
-        return results
+        return search_engine.batch_search(
+            queries=request.queries,
+            fuzzy_threshold=request.fuzzy_threshold,
+            max_results=request.max_results or settings.max_results,
+            include_suggestions=True
+        )
         
     except Exception as e:
         raise HTTPException(
@@ -241,7 +233,7 @@ async def remove_mapping(
     from the search engine's index.
     """
     try:
-        success = search_engine.index_manager.remove_mapping(word)
+        success = search_engine.remove_mapping(word)
         
         if success:
             return JSONResponse(
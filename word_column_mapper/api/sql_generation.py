@@ -3,6 +3,8 @@ SQL Query Generation API Endpoint with MCP
 Provides endpoints for natural language to SQL query generation
 """
 
+import os
+
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any
@@ -19,6 +21,12 @@ logger = structlog.get_logger()
 sql_router = APIRouter(prefix="/sql", tags=["SQL Generation"])
 
 
+# Resolved once at import; every request uses the same schema file
+SCHEMA_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "form_table_schema.json"
+)
+
+
 def get_schema_path() -> str:
     """
     Get the absolute path to the form_table_schema.json file.
@@ -26,9 +34,7 @@ def get_schema_path() -> str:
     Returns:
         str: Absolute path to the schema file
     """
-    import os
-    script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    return os.path.join(script_dir, "form_table_schema.json")
+    return SCHEMA_PATH
 
 
 class SQLQueryRequest(BaseModel):
@@ -253,7 +259,6 @@ async def sql_health_check():
     try:
         import openai
         from dotenv import load_dotenv
-        import os
         
         # Get the path to form_table_schema.json
         schema_path = get_schema_path()
@@ -36,6 +36,7 @@ class Settings(BaseSettings):
     max_results: int = Field(default=10)
     max_query_length: int = Field(default=100)
     enable_phonetic: bool = Field(default=False)
+    search_workers: int = Field(default=-1)  # -1 uses every core for batch search
     
     # Performance
     max_concurrent_requests: int = Field(default=100)
@@ -1,11 +1,13 @@
 """Core search engine functionality."""
 
+from .bk_tree import BKTree
 from .engine import SearchEngine
 from .fuzzy_matcher import FuzzyMatcher
 from .normalizer import TextNormalizer
 from .index import ForwardIndex, ReverseIndex
 
 __all__ = [
+    "BKTree",
     "SearchEngine",
     "FuzzyMatcher", 
     "TextNormalizer",
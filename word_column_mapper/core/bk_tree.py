@@ -0,0 +1,96 @@
+"""BK-tree index for bounded edit distance lookups."""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class _BKNode:
+    """A single BK-tree node holding every item stored under one key."""
+
+    __slots__ = ("key", "items", "children")
+
+    def __init__(self, key: str, item: Any) -> None:
+        self.key = key
+        self.items: List[Any] = [item]
+        self.children: Dict[int, "_BKNode"] = {}
+
+
+class BKTree:
+    """
+    Burkhard-Keller tree over strings under an integer metric.
+
+    Children are keyed by their distance to the parent, so a radius query
+    only descends into edges whose distance lies within ``d +/- radius``
+    of the current node (triangle inequality).
+    """
+
+    def __init__(self, distance: Callable[[str, str], int]) -> None:
+        """
+        Initialize an empty tree.
+
+        Args:
+            distance: Metric used to compare keys (must satisfy the triangle inequality)
+        """
+        self._distance = distance
+        self._root: Optional[_BKNode] = None
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Number of items stored in the tree."""
+        return self._size
+
+    def add(self, key: str, item: Any) -> None:
+        """
+        Insert an item under a key.
+
+        Args:
+            key: String the metric is computed on
+            item: Payload returned by ``find`` (items sharing a key share a node)
+        """
+        self._size += 1
+
+        if self._root is None:
+            self._root = _BKNode(key, item)
+            return
+
+        node = self._root
+        while True:
+            d = self._distance(key, node.key)
+            if d == 0:
+                node.items.append(item)
+                return
+
+            child = node.children.get(d)
+            if child is None:
+                node.children[d] = _BKNode(key, item)
+                return
+            node = child
+
+    def find(self, query: str, max_distance: int) -> List[Tuple[int, Any]]:
+        """
+        Find all items whose key is within ``max_distance`` of the query.
+
+        Args:
+            query: Query string
+            max_distance: Inclusive search radius
+
+        Returns:
+            List of (distance, item) tuples in no particular order
+        """
+        if self._root is None:
+            return []
+
+        found = []
+        distance = self._distance
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            d = distance(query, node.key)
+            if d <= max_distance:
+                found.extend((d, item) for item in node.items)
+
+            low, high = d - max_distance, d + max_distance
+            for edge, child in node.children.items():
+                if low <= edge <= high:
+                    stack.append(child)
+
+        return found
@@ -1,30 +1,105 @@
 """Main search engine implementation."""
 
+import heapq
+import threading
 import time
-from typing import Dict, List, Optional, Set, Tuple
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Set, Tuple
+
+import numpy as np
+from rapidfuzz import fuzz, process
+from rapidfuzz.distance import Indel
 
 from ..models.response import SearchResult, SearchResponse
+from .bk_tree import BKTree
 from .fuzzy_matcher import FuzzyMatcher
 from .index import IndexManager
 from .normalizer import TextNormalizer
 
+# Largest edit radius served from the BK-tree; wider radii reach most of the
+# tree, where one C-level scan over the word list is cheaper
+BK_TREE_MAX_RADIUS = 2
+
+# Default number of distinct (normalized query, options) responses kept in memory
+SEARCH_CACHE_SIZE = 4096
+
+
+def _weighted_confidence(edit_distance: int, query_length: int, word_length: int) -> float:
+    """Confidence of a match from its weighted edit distance."""
+    if edit_distance == 0:
+        return 1.0
+    # For weighted distance, worst case is all characters replaced (weight 2)
+    max_possible_distance = max(query_length, word_length) * 2
+    return 1.0 - (edit_distance / max_possible_distance) if max_possible_distance > 0 else 0.0
+
+
+def _bucket_matches(
+    extracted: List[Tuple[str, int, int]],
+    negative_longest: int,
+    indices: Tuple[int, ...]
+) -> Iterator[Tuple[int, int, int]]:
+    """Map one length bucket's extract results to (distance, -longest, word index)."""
+    for _, edit_distance, bucket_idx in extracted:
+        yield edit_distance, negative_longest, indices[bucket_idx]
+
+
+@dataclass(frozen=True, eq=False)
+class _SearchSnapshot:
+    """Immutable view of the loaded mappings used by fuzzy search."""
+    
+    words: Tuple[str, ...]
+    normalized_words: Tuple[str, ...]
+    columns: Mapping[str, Tuple[str, ...]]
+    # normalized word -> stored word, mirroring the forward index
+    normalized_lookup: Mapping[str, str]
+    # length -> (word indices, normalized words) of that length
+    length_buckets: Mapping[int, Tuple[Tuple[int, ...], Tuple[str, ...]]]
+    # Length of each normalized word, for vectorized ranking
+    word_lengths: np.ndarray
+    bk_tree: BKTree
+
 
 class SearchEngine:
-    """Main search engine for word-to-column mapping."""
+    """
+    Main search engine for word-to-column mapping.
+    
+    ``search`` is safe to call from multiple threads: it reads from an
+    immutable snapshot that mapping changes replace in a single assignment,
+    and statistics updates are serialized by a lock.
+    """
     
-    def __init__(self, fuzzy_threshold: float = 0.6) -> None:
+    def __init__(
+        self,
+        fuzzy_threshold: float = 0.6,
+        cache_size: int = SEARCH_CACHE_SIZE,
+        workers: int = -1
+    ) -> None:
         """
         Initialize the search engine.
         
         Args:
             fuzzy_threshold: Default threshold for fuzzy matching
+            cache_size: Number of search responses to memoize (0 disables caching)
+            workers: Threads rapidfuzz spreads batch distance rows over (-1 uses all cores)
         """
         self.fuzzy_threshold = fuzzy_threshold
+        self.workers = workers
         self.fuzzy_matcher = FuzzyMatcher(fuzzy_threshold)
         self.normalizer = TextNormalizer()
         self.index_manager = IndexManager()
         
+        # Memoized responses keyed on the snapshot and normalized query;
+        # cleared whenever the snapshot is rebuilt
+        self._search_cached = lru_cache(maxsize=cache_size)(self._search_uncached)
+        self._snapshot = self._build_snapshot()
+        # Set once mappings are loaded; the empty startup snapshot is not ready
+        self._loaded = False
+        
         # Performance tracking
+        self._stats_lock = threading.Lock()
         self._stats = {
             "total_queries": 0,
             "exact_matches": 0,
@@ -35,6 +110,11 @@ class SearchEngine:
             "cache_misses": 0
         }
     
+    @property
+    def is_ready(self) -> bool:
+        """Whether mappings have been loaded (checked without searching)."""
+        return self._loaded
+    
     def load_mappings(self, mappings: Dict[str, List[str]]) -> None:
         """
         Load word-to-column mappings into the engine.
@@ -44,6 +124,24 @@ class SearchEngine:
         """
         for word, columns in mappings.items():
             self.index_manager.add_mapping(word, columns)
+        
+        self._rebuild_snapshot()
+        self._loaded = True
+    
+    def remove_mapping(self, word: str) -> bool:
+        """
+        Remove a word mapping from the engine.
+        
+        Args:
+            word: The word to remove
+            
+        Returns:
+            True if removed, False if not found
+        """
+        removed = self.index_manager.remove_mapping(word)
+        if removed:
+            self._rebuild_snapshot()
+        return removed
     
     def search(
         self, 
@@ -58,7 +156,8 @@ class SearchEngine:
         
         Args:
             query: Search query
-            fuzzy_threshold: Custom fuzzy matching threshold
+            fuzzy_threshold: Accepted for API compatibility; matches are
+                filtered by ``max_edit_distance`` only
             max_results: Maximum number of results to return
             include_suggestions: Whether to include suggestions for no-match queries
             max_edit_distance: Maximum edit distance for fuzzy matches (default: 10)
@@ -66,38 +165,228 @@ class SearchEngine:
         Returns:
             SearchResponse with results and metadata
         """
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         # Validate input
         if not query or not query.strip():
             return self._create_empty_response(query, start_time)
         
         query = query.strip()
-        fuzzy_threshold = fuzzy_threshold or self.fuzzy_threshold
         
-        # Update statistics
-        self._stats["total_queries"] += 1
-        
-        # Always perform fuzzy search with edit distance filter
-        all_results = self._fuzzy_search_with_edit_distance(
-            query, fuzzy_threshold, max_results, max_edit_distance
+        # Case and delimiter variants of a query share one cache entry
+        normalized_query = self.normalizer.normalize(query)
+        misses = self._search_cached.cache_info().misses
+        cached = self._search_cached(
+            self._snapshot, normalized_query, max_results,
+            include_suggestions, max_edit_distance
         )
+        # Another thread's miss can land in between; that only skews the
+        # hit/miss counters, never the response
+        cache_hit = self._search_cached.cache_info().misses == misses
         
-        # Check if we have an exact match
-        has_exact_match = any(
-            result.match_type == "exact" for result in all_results
-        )
+        execution_time = (time.perf_counter_ns() - start_time) / 1e6
+        self._record_search(cached, execution_time, cache_hit)
         
-        if all_results:
-            execution_time = (time.time() - start_time) * 1000
+        return self._finalize_response(cached, query, execution_time, cache_hit)
+    
+    def batch_search(
+        self,
+        queries: List[str],
+        fuzzy_threshold: Optional[float] = None,
+        max_results: int = 10,
+        include_suggestions: bool = True,
+        max_edit_distance: int = 10
+    ) -> List[SearchResponse]:
+        """
+        Search for several queries at once.
+        
+        Queries that need a wide scan are scored against the whole word list
+        in one ``process.cdist`` call instead of one scan per query. Each
+        response matches what ``search`` returns for that query.
+        
+        Args:
+            queries: Search queries
+            fuzzy_threshold: Accepted for API compatibility; matches are
+                filtered by ``max_edit_distance`` only
+            max_results: Maximum number of results per query
+            include_suggestions: Whether to include suggestions for no-match queries
+            max_edit_distance: Maximum edit distance for fuzzy matches (default: 10)
+            
+        Returns:
+            One SearchResponse per query, in input order
+        """
+        start_time = time.perf_counter_ns()
+        snapshot = self._snapshot
+        
+        normalized_queries = [
+            self.normalizer.normalize(query.strip()) if query and query.strip() else None
+            for query in queries
+        ]
+        distinct_queries = list(dict.fromkeys(q for q in normalized_queries if q is not None))
+        
+        computed: Dict[str, SearchResponse] = {}
+        if distinct_queries and snapshot.words and max_edit_distance > BK_TREE_MAX_RADIUS:
+            distance_matrix = process.cdist(
+                distinct_queries,
+                snapshot.normalized_words,
+                scorer=Indel.distance,
+                score_cutoff=max_edit_distance,
+                dtype=np.int32,
+                workers=self.workers
+            )
+            for normalized_query, row in zip(distinct_queries, distance_matrix):
+                indices = np.flatnonzero(row <= max_edit_distance)
+                distances = row[indices]
+                # Same order as _rank_matches: at a fixed distance confidence
+                # only grows with the longer of the two lengths
+                longest = np.maximum(len(normalized_query), snapshot.word_lengths[indices])
+                order = np.lexsort((indices, -longest, distances))
+                ranked = (
+                    (
+                        edit_distance,
+                        -_weighted_confidence(edit_distance, len(normalized_query), word_length),
+                        idx
+                    )
+                    for edit_distance, word_length, idx in zip(
+                        distances[order].tolist(),
+                        snapshot.word_lengths[indices[order]].tolist(),
+                        indices[order].tolist()
+                    )
+                )
+                results = self._materialize_results(
+                    snapshot, normalized_query, ranked, max_results
+                )
+                computed[normalized_query] = self._build_search_response(
+                    snapshot, normalized_query, results, include_suggestions
+                )
+        else:
+            # Small radii are served by the BK-tree, which beats a full scan
+            for normalized_query in distinct_queries:
+                computed[normalized_query] = self._search_cached(
+                    snapshot, normalized_query, max_results,
+                    include_suggestions, max_edit_distance
+                )
+        
+        # The batch is scored as a whole, so each query is charged an equal share
+        execution_time = (time.perf_counter_ns() - start_time) / 1e6 / max(len(queries), 1)
+        
+        responses = []
+        for query, normalized_query in zip(queries, normalized_queries):
+            if normalized_query is None:
+                responses.append(self._create_empty_response(query, start_time))
+                continue
+            
+            response = computed[normalized_query]
+            self._record_search(response, execution_time, cache_hit=False)
+            responses.append(
+                self._finalize_response(response, query.strip(), execution_time, cache_hit=False)
+            )
+        
+        return responses
+    
+    def _record_search(
+        self,
+        response: SearchResponse,
+        execution_time: float,
+        cache_hit: bool
+    ) -> None:
+        """Add one served query to the engine statistics."""
+        with self._stats_lock:
+            self._stats["total_queries"] += 1
+            
+            if cache_hit:
+                self._stats["cache_hits"] += 1
+            else:
+                self._stats["cache_misses"] += 1
             
             # Update statistics based on match type
-            if has_exact_match:
+            if response.exact_match:
                 self._stats["exact_matches"] += 1
-            else:
+            elif response.results:
                 self._stats["fuzzy_matches"] += 1
+            else:
+                self._stats["no_matches"] += 1
             
             self._stats["total_execution_time"] += execution_time
+    
+    def _finalize_response(
+        self,
+        response: SearchResponse,
+        query: str,
+        execution_time: float,
+        cache_hit: bool
+    ) -> SearchResponse:
+        """Stamp a shared response with per-call fields, copying what callers may mutate."""
+        return response.model_copy(update={
+            "query": query,
+            "execution_time_ms": execution_time,
+            "results": [
+                result.model_copy(update={"columns": list(result.columns)})
+                for result in response.results
+            ],
+            "total_unique_columns": list(response.total_unique_columns),
+            "total_all_columns": list(response.total_all_columns),
+            "cache_hit": cache_hit,
+            "suggestions": list(response.suggestions) if response.suggestions is not None else None,
+            "timestamp": datetime.utcnow()
+        })
+    
+    def _search_uncached(
+        self,
+        snapshot: _SearchSnapshot,
+        normalized_query: str,
+        max_results: int,
+        include_suggestions: bool,
+        max_edit_distance: int
+    ) -> SearchResponse:
+        """
+        Run a search for an already normalized query.
+        
+        Results only depend on the arguments, which is what lets ``search``
+        memoize this method.
+        
+        Args:
+            snapshot: Snapshot of the loaded mappings to search
+            normalized_query: Normalized search query
+            max_results: Maximum number of results to return
+            include_suggestions: Whether to include suggestions for no-match queries
+            max_edit_distance: Maximum edit distance for fuzzy matches
+            
+        Returns:
+            SearchResponse for the normalized query (timing filled in by ``search``)
+        """
+        # Always perform fuzzy search with edit distance filter
+        all_results = self._fuzzy_search_with_edit_distance(
+            normalized_query, max_results, max_edit_distance, snapshot
+        )
+        return self._build_search_response(
+            snapshot, normalized_query, all_results, include_suggestions
+        )
+    
+    def _build_search_response(
+        self,
+        snapshot: _SearchSnapshot,
+        normalized_query: str,
+        all_results: List[SearchResult],
+        include_suggestions: bool
+    ) -> SearchResponse:
+        """
+        Assemble the response for a normalized query from its ranked results.
+        
+        Args:
+            snapshot: Snapshot the results came from
+            normalized_query: Normalized search query
+            all_results: Ranked search results
+            include_suggestions: Whether to include suggestions for no-match queries
+            
+        Returns:
+            SearchResponse with timing left for the caller to fill in
+        """
+        if all_results:
+            # Check if we have an exact match
+            has_exact_match = any(
+                result.match_type == "exact" for result in all_results
+            )
             
             # Collect all columns (including duplicates)
             all_columns = []
@@ -108,8 +397,8 @@ class SearchEngine:
             unique_columns = list(set(all_columns))
             
             return SearchResponse(
-                query=query,
-                execution_time_ms=execution_time,
+                query=normalized_query,
+                execution_time_ms=0.0,
                 exact_match=has_exact_match,
                 total_results=len(all_results),
                 results=all_results,
@@ -120,17 +409,13 @@ class SearchEngine:
             )
         
         # No matches found
-        execution_time = (time.time() - start_time) * 1000
-        self._stats["no_matches"] += 1
-        self._stats["total_execution_time"] += execution_time
-        
         suggestions = None
         if include_suggestions:
-            suggestions = self._get_suggestions(query)
+            suggestions = self._get_suggestions(normalized_query, snapshot=snapshot)
         
         return SearchResponse(
-            query=query,
-            execution_time_ms=execution_time,
+            query=normalized_query,
+            execution_time_ms=0.0,
             exact_match=False,
             total_results=0,
             results=[],
@@ -150,13 +435,13 @@ class SearchEngine:
         Returns:
             Dictionary with words and metadata, or None if not found
         """
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         words = self.index_manager.reverse_index.get_words(column_id)
         if not words:
             return None
         
-        execution_time = (time.time() - start_time) * 1000
+        execution_time = (time.perf_counter_ns() - start_time) / 1e6
         
         return {
             "column_id": column_id,
@@ -165,7 +450,7 @@ class SearchEngine:
             "execution_time_ms": execution_time
         }
     
-    def intersection_search(self, words: List[str]) -> Optional[Dict[str, any]]:
+    def intersection_search(self, words: Sequence[str]) -> Optional[Dict[str, any]]:
         """
         Find columns that are common to all specified words.
         
@@ -175,30 +460,30 @@ class SearchEngine:
         Returns:
             Dictionary with intersection results, or None if no common columns
         """
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         if len(words) < 2:
             return None
         
         # Get columns for each word
+        snapshot = self._snapshot
         word_columns = []
         for word in words:
-            columns = self.index_manager.forward_index.get_columns(word)
+            columns = self._resolve_columns(snapshot, word)
             if columns:
-                word_columns.append(set(columns))
+                word_columns.append(columns)
         
         if not word_columns:
             return None
         
-        # Find intersection
-        intersection = word_columns[0]
-        for columns in word_columns[1:]:
-            intersection = intersection.intersection(columns)
+        # Find intersection, starting from the smallest column tuple
+        word_columns.sort(key=len)
+        intersection = set(word_columns[0]).intersection(*word_columns[1:])
         
         if not intersection:
             return None
         
-        execution_time = (time.time() - start_time) * 1000
+        execution_time = (time.perf_counter_ns() - start_time) / 1e6
         
         return {
             "query_words": words,
@@ -208,7 +493,7 @@ class SearchEngine:
             "total_common_columns": len(intersection)
         }
     
-    def union_search(self, words: List[str]) -> Optional[Dict[str, any]]:
+    def union_search(self, words: Sequence[str]) -> Optional[Dict[str, any]]:
         """
         Find all columns that are associated with any of the specified words.
         
@@ -218,22 +503,23 @@ class SearchEngine:
         Returns:
             Dictionary with union results, or None if no columns found
         """
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         if not words:
             return None
         
         # Get columns for each word
+        snapshot = self._snapshot
         all_columns = set()
         for word in words:
-            columns = self.index_manager.forward_index.get_columns(word)
+            columns = self._resolve_columns(snapshot, word)
             if columns:
                 all_columns.update(columns)
         
         if not all_columns:
             return None
         
-        execution_time = (time.time() - start_time) * 1000
+        execution_time = (time.perf_counter_ns() - start_time) / 1e6
         
         return {
             "query_words": words,
@@ -243,6 +529,25 @@ class SearchEngine:
             "total_unique_columns": len(all_columns)
         }
     
+    def _resolve_columns(
+        self, snapshot: _SearchSnapshot, word: str
+    ) -> Optional[Tuple[str, ...]]:
+        """
+        Look up a word's columns, matching exactly first and then normalized.
+        
+        Args:
+            snapshot: Snapshot to read from
+            word: The word to look up
+            
+        Returns:
+            Tuple of columns or None if the word is not indexed
+        """
+        if word not in snapshot.columns:
+            word = snapshot.normalized_lookup.get(self.normalizer.normalize(word))
+            if word is None:
+                return None
+        return snapshot.columns[word]
+    
     def _exact_search(self, query: str) -> Optional[SearchResult]:
         """
         Perform exact search for a query.
@@ -311,88 +616,252 @@ class SearchEngine:
     
     def _fuzzy_search_with_edit_distance(
         self, 
-        query: str, 
-        threshold: float, 
+        normalized_query: str, 
         max_results: int,
-        max_edit_distance: int
+        max_edit_distance: int,
+        snapshot: Optional[_SearchSnapshot] = None
     ) -> List[SearchResult]:
         """
         Perform fuzzy search with edit distance filtering.
         
         Args:
-            query: Search query
-            threshold: Fuzzy matching threshold
+            normalized_query: Normalized search query
             max_results: Maximum number of results
             max_edit_distance: Maximum edit distance allowed
+            snapshot: Snapshot to search (defaults to the current one)
             
         Returns:
             List of SearchResult objects
         """
-        all_words = self.index_manager.forward_index.get_all_words()
-        if not all_words:
+        snapshot = snapshot or self._snapshot
+        if not snapshot.words:
             return []
         
-        # Calculate edit distance for ALL words in the database using weighted distance
-        normalized_query = self.normalizer.normalize(query)
+        if max_edit_distance <= BK_TREE_MAX_RADIUS:
+            # Tight radius: the BK-tree only visits nodes that can be in range
+            matches = snapshot.bk_tree.find(normalized_query, max_edit_distance)
+            return self._rank_matches(snapshot, normalized_query, matches, max_results)
+        
+        ranked = self._iter_bucket_matches(
+            snapshot, normalized_query, max_edit_distance, max_results
+        )
+        return self._materialize_results(snapshot, normalized_query, ranked, max_results)
+    
+    def _iter_bucket_matches(
+        self,
+        snapshot: _SearchSnapshot,
+        normalized_query: str,
+        max_edit_distance: int,
+        max_results: int
+    ) -> Iterator[Tuple[int, float, int]]:
+        """
+        Lazily yield the best words within the edit distance budget, best first.
+        
+        The weighted distance is at least the length difference, so only
+        buckets within max_edit_distance of the query length can match. Each
+        bucket is scored in a single C loop that returns its matches sorted by
+        (distance, index); within a bucket the confidence only depends on the
+        distance, so merging the buckets yields the ``_rank_matches`` order
+        and ranking stops as soon as enough results have been taken.
+        
+        Every indexed word has at least one column, so no bucket can
+        contribute more than its own best ``max_results`` to the answer.
+        
+        Args:
+            snapshot: Snapshot to search
+            normalized_query: Normalized search query
+            max_edit_distance: Maximum edit distance allowed
+            max_results: Maximum number of results the caller will take
+            
+        Returns:
+            Iterator of (edit distance, -confidence, word index) tuples
+        """
+        query_length = len(normalized_query)
+        sorted_buckets = []
+        for length in range(
+            query_length - max_edit_distance, query_length + max_edit_distance + 1
+        ):
+            bucket = snapshot.length_buckets.get(length)
+            if bucket is None:
+                continue
+            indices, words = bucket
+            # Confidence falls as the longer of the two lengths shrinks
+            negative_longest = -max(query_length, length)
+            sorted_buckets.append(_bucket_matches(
+                process.extract(
+                    normalized_query,
+                    words,
+                    scorer=Indel.distance,
+                    score_cutoff=max_edit_distance,
+                    limit=max_results
+                ),
+                negative_longest,
+                indices
+            ))
+        
+        for edit_distance, negative_longest, idx in heapq.merge(*sorted_buckets):
+            confidence = _weighted_confidence(edit_distance, query_length, -negative_longest)
+            yield edit_distance, -confidence, idx
+    
+    def _rank_matches(
+        self,
+        snapshot: _SearchSnapshot,
+        normalized_query: str,
+        matches: List[Tuple[int, int]],
+        max_results: int
+    ) -> List[SearchResult]:
+        """
+        Rank matches and materialize the top results.
         
+        Args:
+            snapshot: Snapshot the matches were found in
+            normalized_query: Normalized search query
+            matches: (edit distance, word index) tuples
+            max_results: Maximum number of results
+            
+        Returns:
+            List of SearchResult objects
+        """
+        # Rank by edit distance (ascending), then confidence (descending),
+        # then index order so ties stay stable
+        query_length = len(normalized_query)
+        normalized_words = snapshot.normalized_words
+        ranked = [
+            (
+                edit_distance,
+                -_weighted_confidence(edit_distance, query_length, len(normalized_words[idx])),
+                idx
+            )
+            for edit_distance, idx in matches
+        ]
+        ranked.sort()
+        return self._materialize_results(snapshot, normalized_query, ranked, max_results)
+    
+    def _materialize_results(
+        self,
+        snapshot: _SearchSnapshot,
+        normalized_query: str,
+        ranked: Iterable[Tuple[int, float, int]],
+        max_results: int
+    ) -> List[SearchResult]:
+        """
+        Build SearchResults for the best ranked matches.
+        
+        Args:
+            snapshot: Snapshot the matches were found in
+            normalized_query: Normalized search query
+            ranked: (edit distance, -confidence, word index) tuples, best first
+            max_results: Maximum number of results
+            
+        Returns:
+            List of SearchResult objects
+        """
+        # Only materialize the results that make the cut
         results = []
-        for word in all_words:
-            normalized_word = self.normalizer.normalize(word)
+        for edit_distance, negative_confidence, idx in ranked:
+            word = snapshot.words[idx]
+            columns = snapshot.columns[word]
+            if not columns:
+                continue
             
-            # Use weighted edit distance: insert/delete=1, replace=2
-            edit_distance = self.fuzzy_matcher.weighted_edit_distance(normalized_query, normalized_word)
+            if edit_distance == 0:
+                match_type = "exact"
+                changes = None
+            else:
+                match_type = "fuzzy_weighted"
+                changes = self.fuzzy_matcher.get_edit_operations(
+                    normalized_query, snapshot.normalized_words[idx], edit_distance
+                )
             
-            # Only include words with edit distance <= max_edit_distance
-            if edit_distance <= max_edit_distance:
-                columns = self.index_manager.forward_index.get_columns(word)
-                if columns:
-                    # Determine match type and confidence
-                    if edit_distance == 0:
-                        confidence = 1.0
-                        match_type = "exact"
-                        changes = None
-                    else:
-                        # Calculate confidence based on weighted edit distance
-                        max_len = max(len(normalized_query), len(normalized_word))
-                        # For weighted distance, worst case is all characters replaced (weight 2)
-                        max_possible_distance = max_len * 2
-                        confidence = 1.0 - (edit_distance / max_possible_distance) if max_possible_distance > 0 else 0.0
-                        match_type = "fuzzy_weighted"
-                        changes = self.fuzzy_matcher.get_edit_operations(query, word)
-                    
-                    result = SearchResult(
-                        word=word,
-                        confidence=confidence,
-                        match_type=match_type,
-                        columns=columns,
-                        edit_distance=edit_distance,
-                        changes=changes
-                    )
-                    results.append(result)
+            results.append(SearchResult(
+                word=word,
+                confidence=-negative_confidence,
+                match_type=match_type,
+                columns=list(columns),
+                edit_distance=edit_distance,
+                changes=changes
+            ))
+            if len(results) >= max_results:
+                break
         
-        # Sort by edit distance (ascending), then confidence (descending)
-        results.sort(key=lambda x: (x.edit_distance, -x.confidence))
-        return results[:max_results]
+        return results
     
-    def _get_suggestions(self, query: str, max_suggestions: int = 5) -> List[str]:
+    def _get_suggestions(
+        self,
+        query: str,
+        max_suggestions: int = 5,
+        snapshot: Optional[_SearchSnapshot] = None
+    ) -> List[str]:
         """
         Get suggestions for a query with no matches.
         
         Args:
-            query: Query to get suggestions for
+            query: Normalized query to get suggestions for
             max_suggestions: Maximum number of suggestions
+            snapshot: Snapshot to draw words from (defaults to the current one)
             
         Returns:
             List of suggested words
         """
-        all_words = self.index_manager.forward_index.get_all_words()
-        return self.fuzzy_matcher.suggest_corrections(
-            query, all_words, max_suggestions
+        snapshot = snapshot or self._snapshot
+        if not query or not snapshot.words:
+            return []
+        
+        # The query arrives normalized, so score it against the normalized
+        # words and report the stored spelling of each hit
+        suggestions = process.extract(
+            query,
+            snapshot.normalized_words,
+            limit=max_suggestions,
+            scorer=fuzz.ratio,
+            score_cutoff=self.fuzzy_matcher.threshold * 100
+        )
+        return [snapshot.words[idx] for _, _, idx in suggestions]
+    
+    def _build_snapshot(self) -> _SearchSnapshot:
+        """Build an immutable search snapshot from the current index."""
+        forward_index = self.index_manager.forward_index
+        words = tuple(forward_index.get_all_words())
+        # Words were normalized once when they were added
+        normalized_keys = forward_index.get_normalized_keys()
+        normalized_words = tuple(normalized_keys[word] for word in words)
+        columns = MappingProxyType({
+            word: tuple(forward_index.get_columns(word) or ()) for word in words
+        })
+        normalized_lookup = MappingProxyType(forward_index.get_normalized_index())
+        
+        buckets: Dict[int, Tuple[List[int], List[str]]] = {}
+        for idx, normalized_word in enumerate(normalized_words):
+            indices, bucket_words = buckets.setdefault(len(normalized_word), ([], []))
+            indices.append(idx)
+            bucket_words.append(normalized_word)
+        length_buckets = MappingProxyType({
+            length: (tuple(indices), tuple(bucket_words))
+            for length, (indices, bucket_words) in buckets.items()
+        })
+        
+        bk_tree = BKTree(Indel.distance)
+        for idx, normalized_word in enumerate(normalized_words):
+            bk_tree.add(normalized_word, idx)
+        
+        return _SearchSnapshot(
+            words=words,
+            normalized_words=normalized_words,
+            columns=columns,
+            normalized_lookup=normalized_lookup,
+            length_buckets=length_buckets,
+            word_lengths=np.fromiter(map(len, normalized_words), dtype=np.int32, count=len(normalized_words)),
+            bk_tree=bk_tree
         )
     
-    def _create_empty_response(self, query: str, start_time: float) -> SearchResponse:
+    def _rebuild_snapshot(self) -> None:
+        """Publish a fresh snapshot of the index and drop memoized searches."""
+        self._snapshot = self._build_snapshot()
+        self._search_cached.cache_clear()
+    
+    def _create_empty_response(self, query: str, start_time: int) -> SearchResponse:
         """Create an empty response for invalid queries."""
-        execution_time = (time.time() - start_time) * 1000
+        execution_time = (time.perf_counter_ns() - start_time) / 1e6
         
         return SearchResponse(
             query=query or "",
@@ -401,13 +870,15 @@ class SearchEngine:
             total_results=0,
             results=[],
             total_unique_columns=[],
+            total_all_columns=[],
             cache_hit=False,
             suggestions=None
         )
     
     def get_stats(self) -> Dict[str, any]:
         """Get engine statistics."""
-        stats = self._stats.copy()
+        with self._stats_lock:
+            stats = self._stats.copy()
         
         # Calculate averages
         if stats["total_queries"] > 0:
@@ -423,6 +894,8 @@ class SearchEngine:
             stats["fuzzy_match_rate"] = 0.0
             stats["no_match_rate"] = 0.0
         
+        stats["cache_size"] = self._search_cached.cache_info().currsize
+        
         # Add index stats
         stats["index_stats"] = self.index_manager.get_stats()
         
@@ -431,12 +904,15 @@ class SearchEngine:
     def clear(self) -> None:
         """Clear all data and reset statistics."""
         self.index_manager.clear()
-        self._stats = {
-            "total_queries": 0,
-            "exact_matches": 0,
-            "fuzzy_matches": 0,
-            "no_matches": 0,
-            "total_execution_time": 0.0,
-            "cache_hits": 0,
-            "cache_misses": 0
-        }
+        self._rebuild_snapshot()
+        self._loaded = False
+        with self._stats_lock:
+            self._stats = {
+                "total_queries": 0,
+                "exact_matches": 0,
+                "fuzzy_matches": 0,
+                "no_matches": 0,
+                "total_execution_time": 0.0,
+                "cache_hits": 0,
+                "cache_misses": 0
+            }
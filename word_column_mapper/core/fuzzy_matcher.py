@@ -1,13 +1,21 @@
 """Fuzzy matching algorithms for typo correction and approximate matching."""
 
 import time
-from typing import List, Optional, Tuple
+from typing import List, Optional, Sequence, Tuple
 
+import numpy as np
 from rapidfuzz import fuzz, process
-from rapidfuzz.distance import Levenshtein
+from rapidfuzz.distance import Indel, Levenshtein
 
 from .normalizer import TextNormalizer
 
+# Match type reported for each ratio (in tie-break order), then the
+# substring and exact overrides
+MATCH_TYPES = (
+    "fuzzy_levenshtein", "fuzzy_partial", "fuzzy_token_sort", "fuzzy_token_set",
+    "fuzzy_substring", "exact"
+)
+
 
 class FuzzyMatcher:
     """Handles fuzzy matching with multiple algorithms and strategies."""
@@ -29,6 +37,9 @@ class FuzzyMatcher:
         - Delete: weight 1  
         - Replace: weight 2
         
+        A replace never beats a delete plus an insert at these weights, so
+        this is the Indel distance and runs on rapidfuzz's bit-parallel kernel.
+        
         Args:
             s1: First string
             s2: Second string
@@ -36,36 +47,7 @@ class FuzzyMatcher:
         Returns:
             Weighted edit distance
         """
-        m, n = len(s1), len(s2)
-        
-        # Create a table to store results of subproblems
-        dp = [[0 for _ in range(n + 1)] for _ in range(m + 1)]
-        
-        # Initialize base cases
-        for i in range(m + 1):
-            dp[i][0] = i  # Delete operations (weight 1)
-        
-        for j in range(n + 1):
-            dp[0][j] = j  # Insert operations (weight 1)
-        
-        # Fill the dp table
-        for i in range(1, m + 1):
-            for j in range(1, n + 1):
-                if s1[i-1] == s2[j-1]:
-                    # Characters match, no operation needed
-                    dp[i][j] = dp[i-1][j-1]
-                else:
-                    # Choose minimum of:
-                    # 1. Delete from s1 (weight 1)
-                    # 2. Insert into s1 (weight 1) 
-                    # 3. Replace in s1 (weight 2)
-                    dp[i][j] = min(
-                        dp[i-1][j] + 1,      # Delete
-                        dp[i][j-1] + 1,      # Insert
-                        dp[i-1][j-1] + 2     # Replace
-                    )
-        
-        return dp[m][n]
+        return Indel.distance(s1, s2)
         
     def find_best_match(
         self, 
@@ -89,32 +71,28 @@ class FuzzyMatcher:
         
         threshold = threshold or self.threshold
         normalized_query = self.normalizer.normalize(query)
+        normalized_candidates = self._normalize_all(candidates)
         
-        best_match = None
-        best_confidence = 0.0
-        best_type = "no_match"
-        best_distance = 0
-        
-        for candidate in candidates:
-            normalized_candidate = self.normalizer.normalize(candidate)
-            
-            # Try exact match first
+        # Try exact match first
+        for candidate, normalized_candidate in zip(candidates, normalized_candidates):
             if normalized_query == normalized_candidate:
                 return candidate, 1.0, "exact", 0
-            
-            # Try fuzzy matching
-            confidence, match_type, distance = self._calculate_fuzzy_match(
-                normalized_query, normalized_candidate, candidate
-            )
-            
-            if confidence > best_confidence and confidence >= threshold:
-                best_match = candidate
-                best_confidence = confidence
-                best_type = match_type
-                best_distance = distance
         
+        confidences, match_types, distances = self._calculate_fuzzy_matches(
+            normalized_query, normalized_candidates
+        )
+        confidences[confidences < threshold] = 0.0
+        
+        # argmax keeps the first candidate among equally confident ones
+        best_idx = int(confidences.argmax())
+        best_match = candidates[best_idx] if confidences[best_idx] > 0.0 else None
         if best_match:
-            return best_match, best_confidence, best_type, best_distance
+            return (
+                best_match,
+                float(confidences[best_idx]),
+                MATCH_TYPES[match_types[best_idx]],
+                int(distances[best_idx])
+            )
         
         return None
     
@@ -142,97 +120,118 @@ class FuzzyMatcher:
         
         threshold = threshold or self.threshold
         normalized_query = self.normalizer.normalize(query)
+        normalized_candidates = self._normalize_all(candidates)
         
-        matches = []
+        confidences, match_types, distances = self._calculate_fuzzy_matches(
+            normalized_query, normalized_candidates
+        )
+        matched = confidences >= threshold
         
-        for candidate in candidates:
-            normalized_candidate = self.normalizer.normalize(candidate)
-            
-            # Try exact match first
+        # Exact matches are always reported, whatever the threshold
+        for idx, normalized_candidate in enumerate(normalized_candidates):
             if normalized_query == normalized_candidate:
-                matches.append((candidate, 1.0, "exact", 0))
-                # Don't continue - we want to also check for fuzzy matches
-            
-            # Try fuzzy matching for all candidates
-            confidence, match_type, distance = self._calculate_fuzzy_match(
-                normalized_query, normalized_candidate, candidate
+                confidences[idx] = 1.0
+                match_types[idx] = MATCH_TYPES.index("exact")
+                distances[idx] = 0
+                matched[idx] = True
+        
+        # Sort by confidence (descending) and return top results; the stable
+        # sort keeps candidate order for ties
+        indices = np.flatnonzero(matched)
+        top = indices[np.argsort(-confidences[indices], kind="stable")[:max_results]]
+        
+        return [
+            (candidates[idx], confidence, MATCH_TYPES[match_type], distance)
+            for idx, confidence, match_type, distance in zip(
+                top.tolist(),
+                confidences[top].tolist(),
+                match_types[top].tolist(),
+                distances[top].tolist()
             )
-            
-            if confidence >= threshold:
-                # Only add if it's not already added as exact match
-                if not (normalized_query == normalized_candidate):
-                    matches.append((candidate, confidence, match_type, distance))
-        
-        # Sort by confidence (descending) and return top results
-        matches.sort(key=lambda x: x[1], reverse=True)
-        return matches[:max_results]
+        ]
     
-    def _calculate_fuzzy_match(
+    def _normalize_all(self, candidates: Sequence[str]) -> List[str]:
+        """Normalize every candidate."""
+        return [self.normalizer.normalize(candidate) for candidate in candidates]
+    
+    def _calculate_fuzzy_matches(
         self, 
         query: str, 
-        candidate: str, 
-        original_candidate: str
-    ) -> Tuple[float, str, int]:
+        candidates: Sequence[str]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
-        Calculate fuzzy match between query and candidate.
+        Calculate fuzzy matches between a query and every candidate.
+        
+        Each scorer runs over the whole candidate list in one ``process.cdist``
+        call, so Python never loops over candidates.
         
         Args:
             query: Normalized query
-            candidate: Normalized candidate
-            original_candidate: Original candidate (for partial matching)
+            candidates: Normalized candidates
             
         Returns:
-            Tuple of (confidence, match_type, edit_distance)
+            Arrays of (confidence, index into MATCH_TYPES, edit_distance),
+            one entry per candidate
         """
         # Use weighted edit distance instead of standard Levenshtein
-        distance = self.weighted_edit_distance(query, candidate)
-        max_len = max(len(query), len(candidate))
+        distances = process.cdist([query], candidates, scorer=Indel.distance, dtype=np.int64)[0]
+        lengths = np.fromiter(map(len, candidates), dtype=np.int64, count=len(candidates))
         # Adjust ratio calculation for weighted distance
         # Since replace operations have weight 2, we need to normalize differently
-        max_possible_distance = max_len * 2  # Worst case: all characters replaced
-        levenshtein_ratio = 1.0 - (distance / max_possible_distance) if max_possible_distance > 0 else 0.0
-        
-        # Partial ratio (for substring matches)
-        partial_ratio = fuzz.partial_ratio(query, candidate) / 100.0
-        
-        # Token sort ratio (for word order independence)
-        token_sort_ratio = fuzz.token_sort_ratio(query, candidate) / 100.0
-        
-        # Token set ratio (for word set matching)
-        token_set_ratio = fuzz.token_set_ratio(query, candidate) / 100.0
-        
-        # Choose the best match type and confidence
-        ratios = [
-            (levenshtein_ratio, "fuzzy_levenshtein", distance),
-            (partial_ratio, "fuzzy_partial", distance),
-            (token_sort_ratio, "fuzzy_token_sort", distance),
-            (token_set_ratio, "fuzzy_token_set", distance),
-        ]
-        
-        # Find the best ratio
-        best_ratio, best_type, best_distance = max(ratios, key=lambda x: x[0])
-        
-        # Boost confidence for exact substring matches and adjust edit distance
-        if query in candidate or candidate in query:
-            best_ratio = min(1.0, best_ratio + 0.1)
-            best_type = "fuzzy_substring"
-            # For substring matches, use the minimum edit distance
-            if query in candidate:
-                # Query is substring of candidate - edit distance is length difference
-                best_distance = len(candidate) - len(query)
-            else:
-                # Candidate is substring of query - edit distance is length difference
-                best_distance = len(query) - len(candidate)
+        max_possible_distances = np.maximum(len(query), lengths) * 2  # Worst case: all characters replaced
+        levenshtein_ratios = np.zeros(len(candidates))
+        np.subtract(
+            1.0, distances / np.maximum(max_possible_distances, 1), 
+            out=levenshtein_ratios, where=max_possible_distances > 0
+        )
         
-        return best_ratio, best_type, best_distance
+        # Partial ratio (for substring matches), token sort ratio (for word
+        # order independence) and token set ratio (for word set matching)
+        partial_ratios = process.cdist(
+            [query], candidates, scorer=fuzz.partial_ratio, dtype=np.float64
+        )[0]
+        ratios = np.vstack([levenshtein_ratios, partial_ratios / 100.0] + [
+            process.cdist([query], candidates, scorer=scorer, dtype=np.float64)[0] / 100.0
+            for scorer in (fuzz.token_sort_ratio, fuzz.token_set_ratio)
+        ])
+        
+        # Choose the best match type and confidence (first one wins ties)
+        match_types = ratios.argmax(axis=0)
+        confidences = ratios.max(axis=0)
+        
+        # Boost confidence for exact substring matches and adjust edit distance.
+        # A non-empty substring always has a partial ratio of 100, so only
+        # those candidates (and empty strings) need the substring test.
+        maybe_substring = partial_ratios == 100.0
+        if not query:
+            maybe_substring[:] = True
+        else:
+            maybe_substring |= lengths == 0
+        substring = np.zeros(len(candidates), dtype=bool)
+        for idx in np.flatnonzero(maybe_substring).tolist():
+            candidate = candidates[idx]
+            substring[idx] = query in candidate or candidate in query
+        
+        confidences[substring] = np.minimum(1.0, confidences[substring] + 0.1)
+        match_types[substring] = MATCH_TYPES.index("fuzzy_substring")
+        # For substring matches, the edit distance is the length difference
+        distances[substring] = np.abs(lengths[substring] - len(query))
+        
+        return confidences, match_types, distances
     
-    def get_edit_operations(self, query: str, target: str) -> str:
+    def get_edit_operations(
+        self,
+        query: str,
+        target: str,
+        weighted_distance: Optional[int] = None
+    ) -> str:
         """
         Get a description of edit operations needed to transform query to target.
         
         Args:
             query: Source string
             target: Target string
+            weighted_distance: Weighted edit distance if the caller already has it
             
         Returns:
             Description of changes
@@ -241,20 +240,21 @@ class FuzzyMatcher:
             return "No changes"
         
         # Use weighted edit distance for analysis
-        weighted_distance = self.weighted_edit_distance(query, target)
-        standard_distance = Levenshtein.distance(query, target)
+        if weighted_distance is None:
+            weighted_distance = self.weighted_edit_distance(query, target)
         
         if len(query) < len(target):
             return f"Insert {len(target) - len(query)} character(s) (weighted distance: {weighted_distance})"
         elif len(query) > len(target):
             return f"Delete {len(query) - len(target)} character(s) (weighted distance: {weighted_distance})"
         else:
+            standard_distance = Levenshtein.distance(query, target)
             return f"Substitute {standard_distance} character(s) (weighted distance: {weighted_distance})"
     
     def suggest_corrections(
         self, 
         query: str, 
-        candidates: List[str], 
+        candidates: Sequence[str], 
         max_suggestions: int = 5
     ) -> List[str]:
         """
@@ -271,14 +271,14 @@ class FuzzyMatcher:
         if not query or not candidates:
             return []
         
-        # Use rapidfuzz's extract function for suggestions
+        # rapidfuzz keeps the top max_suggestions in C and skips candidates
+        # below the threshold via score_cutoff
         suggestions = process.extract(
             query, 
             candidates, 
             limit=max_suggestions,
-            scorer=fuzz.ratio
+            scorer=fuzz.ratio,
+            score_cutoff=self.threshold * 100
         )
         
-        # Filter by threshold and return just the words
-        return [suggestion[0] for suggestion in suggestions 
-                if suggestion[1] >= self.threshold * 100]
+        return [suggestion[0] for suggestion in suggestions]
@@ -14,6 +14,7 @@ class ForwardIndex:
         """Initialize the forward index."""
         self._index: Dict[str, List[str]] = {}
         self._normalized_index: Dict[str, str] = {}  # normalized -> original
+        self._normalized_keys: Dict[str, str] = {}  # original -> normalized
         self.normalizer = TextNormalizer()
         self._stats = {
             "total_words": 0,
@@ -38,6 +39,7 @@ class ForwardIndex:
         # Store the mapping
         self._index[word] = columns.copy()
         self._normalized_index[normalized] = word
+        self._normalized_keys[word] = normalized
         
         # Update statistics
         self._stats["total_words"] = len(self._index)
@@ -54,17 +56,35 @@ class ForwardIndex:
         Returns:
             List of columns or None if not found
         """
+        original_word = self.resolve(word)
+        if original_word is None:
+            return None
+        return self._index[original_word].copy()
+    
+    def resolve(self, word: str) -> Optional[str]:
+        """
+        Resolve a word to the key it is stored under.
+        
+        Args:
+            word: The word to look up
+            
+        Returns:
+            The stored word (exact match first, then normalized match) or None
+        """
         # Try exact match first
         if word in self._index:
-            return self._index[word].copy()
+            return word
         
         # Try normalized match
-        normalized = self.normalizer.normalize(word)
-        if normalized in self._normalized_index:
-            original_word = self._normalized_index[normalized]
-            return self._index[original_word].copy()
-        
-        return None
+        return self._normalized_index.get(self.normalizer.normalize(word))
+    
+    def get_normalized_index(self) -> Dict[str, str]:
+        """Get a copy of the normalized word -> stored word mapping."""
+        return self._normalized_index.copy()
+    
+    def get_normalized_keys(self) -> Dict[str, str]:
+        """Get a copy of the stored word -> normalized word mapping."""
+        return self._normalized_keys.copy()
     
     def get_all_words(self) -> List[str]:
         """Get all words in the index."""
@@ -110,7 +130,7 @@ class ForwardIndex:
             del self._index[word]
             
             # Remove from normalized index
-            normalized = self.normalizer.normalize(word)
+            normalized = self._normalized_keys.pop(word)
             if normalized in self._normalized_index:
                 del self._normalized_index[normalized]
             
@@ -126,6 +146,7 @@ class ForwardIndex:
         """Clear all mappings."""
         self._index.clear()
         self._normalized_index.clear()
+        self._normalized_keys.clear()
         self._stats = {
             "total_words": 0,
             "total_mappings": 0,
@@ -142,7 +163,9 @@ class ReverseIndex:
     
     def __init__(self) -> None:
         """Initialize the reverse index."""
-        self._index: Dict[str, List[str]] = defaultdict(list)
+        # column -> words, kept as dict keys: O(1) dedup and removal while
+        # preserving insertion order
+        self._index: Dict[str, Dict[str, None]] = defaultdict(dict)
         self._stats = {
             "total_columns": 0,
             "total_mappings": 0,
@@ -160,13 +183,16 @@ class ReverseIndex:
         if not word or not columns:
             return
         
+        added = 0
         for column in columns:
-            if word not in self._index[column]:
-                self._index[column].append(word)
+            words = self._index[column]
+            if word not in words:
+                words[word] = None
+                added += 1
         
-        # Update statistics
+        # Update statistics incrementally instead of re-summing every column
         self._stats["total_columns"] = len(self._index)
-        self._stats["total_mappings"] = sum(len(words) for words in self._index.values())
+        self._stats["total_mappings"] += added
         self._stats["last_updated"] = time.time()
     
     def get_words(self, column: str) -> Optional[List[str]]:
@@ -180,7 +206,7 @@ class ReverseIndex:
             List of words or None if not found
         """
         if column in self._index:
-            return self._index[column].copy()
+            return list(self._index[column])
         return None
     
     def get_all_columns(self) -> List[str]:
@@ -195,17 +221,20 @@ class ReverseIndex:
             word: The word to remove
             columns: List of column identifiers
         """
+        removed = 0
         for column in columns:
-            if column in self._index and word in self._index[column]:
-                self._index[column].remove(word)
+            words = self._index.get(column)
+            if words and word in words:
+                del words[word]
+                removed += 1
                 
                 # Remove column if no words left
-                if not self._index[column]:
+                if not words:
                     del self._index[column]
         
-        # Update statistics
+        # Update statistics incrementally instead of re-summing every column
         self._stats["total_columns"] = len(self._index)
-        self._stats["total_mappings"] = sum(len(words) for words in self._index.values())
+        self._stats["total_mappings"] -= removed
         self._stats["last_updated"] = time.time()
     
     def clear(self) -> None:
@@ -4,21 +4,21 @@ import re
 import unicodedata
 from typing import List, Set
 
+# Maps hyphens and underscores to spaces so one str.split() handles every delimiter
+_DELIMITERS_TO_SPACE = str.maketrans("-_", "  ")
+# Drops hyphens and underscores (whitespace is dropped by split/join)
+_DELIMITERS_REMOVED = str.maketrans("", "", "-_")
+# Folds hyphens into underscores so runs of either split on one character
+_HYPHENS_TO_UNDERSCORES = str.maketrans("-", "_")
+_UNDERSCORE_RUNS = re.compile(r'_+')
+
 
 class TextNormalizer:
     """Handles text normalization for consistent word processing."""
     
     def __init__(self) -> None:
         """Initialize the normalizer."""
-        # Common delimiter patterns
-        self.delimiter_patterns = [
-            r'[-_]',  # hyphens and underscores
-            r'\s+',   # whitespace
-        ]
-        
-        # Compile regex patterns for performance
-        self.delimiter_regex = re.compile('|'.join(self.delimiter_patterns))
-        
+    
     def normalize(self, text: str) -> str:
         """
         Normalize text for consistent processing.
@@ -35,19 +35,13 @@ class TextNormalizer:
         # Convert to lowercase
         normalized = text.lower()
         
-        # Normalize Unicode characters
-        normalized = unicodedata.normalize('NFKD', normalized)
+        # Normalize Unicode characters (NFKD leaves ASCII unchanged)
+        if not normalized.isascii():
+            normalized = unicodedata.normalize('NFKD', normalized)
         
-        # Replace delimiters with underscores
-        normalized = self.delimiter_regex.sub('_', normalized)
-        
-        # Remove extra underscores
-        normalized = re.sub(r'_+', '_', normalized)
-        
-        # Strip leading/trailing underscores
-        normalized = normalized.strip('_')
-        
-        return normalized
+        # Join delimiter-separated tokens with single underscores; split()
+        # collapses runs and drops leading/trailing delimiters in C
+        return '_'.join(normalized.translate(_DELIMITERS_TO_SPACE).split())
     
     def generate_variants(self, text: str) -> Set[str]:
         """
@@ -65,18 +59,22 @@ class TextNormalizer:
         normalized = self.normalize(text)
         variants.add(normalized)
         
+        lowered = text.lower()
+        
         # Without delimiters
-        no_delimiters = re.sub(r'[-_\s]+', '', text.lower())
+        no_delimiters = ''.join(lowered.translate(_DELIMITERS_REMOVED).split())
         if no_delimiters:
             variants.add(no_delimiters)
         
-        # With spaces instead of underscores
-        with_spaces = re.sub(r'[-_]+', ' ', text.lower()).strip()
+        # With spaces instead of underscores; each run of delimiters becomes one space
+        with_spaces = ' '.join(
+            filter(None, lowered.translate(_HYPHENS_TO_UNDERSCORES).split('_'))
+        ).strip()
         if with_spaces:
             variants.add(with_spaces)
         
         # With hyphens instead of underscores
-        with_hyphens = re.sub(r'[_]+', '-', text.lower()).strip()
+        with_hyphens = _UNDERSCORE_RUNS.sub('-', lowered).strip()
         if with_hyphens:
             variants.add(with_hyphens)
         
@@ -5,4 +5,8 @@ from .config import get_settings
 
 # Global search engine instance
 settings = get_settings()
-search_engine = SearchEngine(fuzzy_threshold=settings.fuzzy_threshold)
+search_engine = SearchEngine(
+    fuzzy_threshold=settings.fuzzy_threshold,
+    cache_size=settings.cache_max_size if settings.enable_cache else 0,
+    workers=settings.search_workers
+)
@@ -1,82 +1,98 @@
+import os
 import psycopg2
 import csv
 
-# ---------- Database Connection ----------
-conn = psycopg2.connect(
-    host="localhost",     # change
-    port="5432",          # change
-    database="strategicerp",   # change
-    user="db_user",     # change
-    password="itacs9"  # change
+# ---------- CONFIGURATION ----------
+DB_CONFIG = {
+    "host": "localhost",     # change
+    "port": "5432",          # change
+    "database": "strategicerp",   # change
+    "user": "db_user",     # change
+    "password": "itacs9"  # change
+}
+# Written next to this script, where csv_to_json.py reads it
+OUTPUT_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "form_table_columns.csv")
+BATCH_SIZE = 50   # process 50 tables at a time
+
+# ---------- COLUMN QUERY (per batch of table ids) ----------
+COLUMNS_QUERY = """
+WITH cols AS (
+    SELECT 
+        table_name, 
+        column_name, 
+        data_type, 
+        character_maximum_length, 
+        is_nullable,
+        CASE 
+            WHEN column_name LIKE 'column%' 
+                 AND column_name ~ 'column[0-9]+' 
+            THEN regexp_replace(column_name, '^column', '')
+            WHEN column_name = 'state'
+            THEN 'Status'
+            ELSE column_name
+        END AS clean_column_name
+    FROM information_schema.columns
+    WHERE table_name IN (
+        SELECT 'table' || id AS table_name 
+        FROM form_table
+        WHERE id IN ({placeholders})
+    ) 
+    AND column_name NOT IN (
+        'id','created_by','created_date','modified_by',
+        'modified_date','additionalfields','active',
+        'parentstatereportid','state','stateownerid'
+    )
 )
-cur = conn.cursor()
+SELECT 
+    c.table_name,
+    c.column_name,
+    f.field_name
+FROM cols c
+LEFT JOIN form_fields f
+    ON (
+        (c.clean_column_name ~ '^[0-9]+$' AND f.id::text = c.clean_column_name)
+        OR (f.field_name = c.column_name)
+    )
+    AND (c.table_name = 'table' || f.parent_id OR c.table_name = 'table' || f.relation) WHERE f.field_name is not null;
+"""
 
-# ---------- Get all table ids ----------
-cur.execute("SELECT id FROM form_table ORDER BY id;")
-all_ids = [row[0] for row in cur.fetchall()]
 
-batch_size = 50   # process 50 tables at a time
-results = []
+def main():
+    """Dump every form table column with its field name to OUTPUT_FILE and return the row count."""
+    # ---------- Database Connection ----------
+    conn = psycopg2.connect(**DB_CONFIG)
+    cur = conn.cursor()
 
-# ---------- Process in Batches ----------
-for i in range(0, len(all_ids), batch_size):
-    batch_ids = all_ids[i:i+batch_size]
-    placeholders = ",".join([str(x) for x in batch_ids])
+    try:
+        # ---------- Get all table ids ----------
+        cur.execute("SELECT id FROM form_table ORDER BY id;")
+        all_ids = [row[0] for row in cur.fetchall()]
 
-    query = f"""
-    WITH cols AS (
-        SELECT 
-            table_name, 
-            column_name, 
-            data_type, 
-            character_maximum_length, 
-            is_nullable,
-            CASE 
-                WHEN column_name LIKE 'column%' 
-                     AND column_name ~ 'column[0-9]+' 
-                THEN regexp_replace(column_name, '^column', '')
-                WHEN column_name = 'state'
-                THEN 'Status'
-                ELSE column_name
-            END AS clean_column_name
-        FROM information_schema.columns
-        WHERE table_name IN (
-            SELECT 'table' || id AS table_name 
-            FROM form_table
-            WHERE id IN ({placeholders})
-        ) 
-        AND column_name NOT IN (
-            'id','created_by','created_date','modified_by',
-            'modified_date','additionalfields','active',
-            'parentstatereportid','state','stateownerid'
-        )
-    )
-    SELECT 
-        c.table_name,
-        c.column_name,
-        f.field_name
-    FROM cols c
-    LEFT JOIN form_fields f
-        ON (
-            (c.clean_column_name ~ '^[0-9]+$' AND f.id::text = c.clean_column_name)
-            OR (f.field_name = c.column_name)
-        )
-        AND (c.table_name = 'table' || f.parent_id OR c.table_name = 'table' || f.relation) WHERE f.field_name is not null;
-    """
+        results = []
+
+        # ---------- Process in Batches ----------
+        for i in range(0, len(all_ids), BATCH_SIZE):
+            batch_ids = all_ids[i:i+BATCH_SIZE]
+            placeholders = ",".join([str(x) for x in batch_ids])
+
+            cur.execute(COLUMNS_QUERY.format(placeholders=placeholders))
+            batch_results = cur.fetchall()
+            results.extend(batch_results)
 
-    cur.execute(query)
-    batch_results = cur.fetchall()
-    results.extend(batch_results)
+            print(f"Processed batch {i//BATCH_SIZE + 1} / {(len(all_ids)-1)//BATCH_SIZE + 1}")
+    finally:
+        cur.close()
+        conn.close()
 
-    print(f"Processed batch {i//batch_size + 1} / {(len(all_ids)-1)//batch_size + 1}")
+    # ---------- Write to CSV ----------
+    with open(OUTPUT_FILE, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["table_name","column_name", "field_name"])
+        writer.writerows(results)
 
-# ---------- Write to CSV ----------
-with open("form_table_columns.csv", "w", newline="", encoding="utf-8") as f:
-    writer = csv.writer(f)
-    writer.writerow(["table_name","column_name", "field_name"])
-    writer.writerows(results)
+    print(f"✅ Data saved to {os.path.basename(OUTPUT_FILE)}")
+    return len(results)
 
-print("✅ Data saved to form_table_columns.csv")
 
-cur.close()
-conn.close()
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,15 @@
 """Main FastAPI application for the Word Column Mapper."""
 
-import json
 import os
 import time
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
+import orjson
 from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 import structlog
 
@@ -57,8 +57,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Load mappings from JSON file
     try:
         json_file_path = os.path.join(os.path.dirname(__file__), "sample_mappings2.json")
-        with open(json_file_path, 'r', encoding='utf-8') as f:
-            sample_mappings = json.load(f)
+        with open(json_file_path, 'rb') as f:
+            sample_mappings = orjson.loads(f.read())
         
         search_engine.load_mappings(sample_mappings)
         logger.info("Sample mappings loaded from JSON", total_words=len(sample_mappings))
@@ -90,6 +90,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -109,7 +110,7 @@ app.add_middleware(GZipMiddleware, minimum_size=1000)
 @app.middleware("http")
 async def log_requests(request: Request, call_next) -> Response:
     """Log all HTTP requests."""
-    start_time = time.time()
+    start_time = time.perf_counter_ns()
     
     # Log request
     logger.info(
@@ -124,7 +125,7 @@ async def log_requests(request: Request, call_next) -> Response:
     response = await call_next(request)
     
     # Log response
-    process_time = time.time() - start_time
+    process_time = (time.perf_counter_ns() - start_time) / 1e9
     logger.info(
         "Request completed",
         method=request.method,
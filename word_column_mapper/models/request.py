@@ -82,6 +82,25 @@ class SetOperationRequest(BaseModel):
         return v.lower()
 
 
+class BatchSetOperationRequest(BaseModel):
+    """Request model for batch set operations."""
+    
+    operations: List[SetOperationRequest] = Field(
+        ..., min_items=1, max_items=100, description="Set operations to perform, in order"
+    )
+
+
+class NaturalLanguageQueryRequest(BaseModel):
+    """Request model for natural language queries."""
+    
+    query: str = Field(default="", description="Natural language question about the data")
+
+    @validator('query')
+    def validate_query(cls, v: str) -> str:
+        """Normalize the query; an empty query is reported by the endpoint."""
+        return v.strip()
+
+
 class MappingUpdateRequest(BaseModel):
     """Request model for updating word-column mappings."""
     
@@ -84,7 +84,7 @@ class MetricsResponse(BaseModel):
     cache_hit_rate: float = Field(..., description="Cache hit rate percentage")
     error_rate: float = Field(..., description="Error rate percentage")
     active_connections: int = Field(..., description="Active connections")
-    memory_usage_mb: float = Field(..., description="Memory usage in MB")
+    memory_usage_mb: float = Field(..., description="Resident memory of the service process in MB")
     timestamp: datetime = Field(default_factory=datetime.utcnow, description="Metrics timestamp")
 
 
@@ -12,6 +12,7 @@ This script:
 
 import json
 import os
+import orjson
 import psycopg2
 import csv
 from typing import Dict, List, Any, Tuple, Optional
@@ -47,7 +48,8 @@ class SQLGeneratorMCP:
         schema_file_path: str = "form_table_schema.json",
         db_config: Optional[Dict[str, str]] = None,
         anthropic_api_key: Optional[str] = None,
-        debug: bool = False
+        debug: bool = False,
+        schema: Optional[Dict[str, Any]] = None
     ):
         """
         Initialize the SQL Generator with MCP.
@@ -57,6 +59,7 @@ class SQLGeneratorMCP:
             db_config: Database configuration dictionary
             anthropic_api_key: Anthropic API key (or from environment)
             debug: Enable debug mode with detailed logging
+            schema: Already loaded table schema; the file is not read when given
         """
         self.schema_file_path = schema_file_path
         self.debug = debug
@@ -67,7 +70,7 @@ class SQLGeneratorMCP:
             script_dir = os.path.dirname(os.path.abspath(__file__))
             self.schema_file_path = os.path.join(script_dir, schema_file_path)
         
-        self.schema = self._load_schema()
+        self.schema = schema if schema is not None else self._load_schema()
         
         # Load settings if available
         self.settings = get_settings() if get_settings else None
@@ -120,7 +123,10 @@ class SQLGeneratorMCP:
         self.enable_sql_validation = self.settings.enable_sql_validation if self.settings else True
         
         # Initialize traversal components (without debug for TableFrequencyRanker)
-        self.traversal = TableRelationshipTraversal(self.schema_file_path, debug=debug)
+        # Share the loaded schema so the file is only parsed once
+        self.traversal = TableRelationshipTraversal(
+            self.schema_file_path, debug=debug, schema=self.schema
+        )
         self.ranker = TableFrequencyRanker()  # No debug parameter
         
         if self.debug:
@@ -139,8 +145,10 @@ class SQLGeneratorMCP:
     def _load_schema(self) -> Dict[str, Any]:
         """Load the table schema from JSON file."""
         try:
-            with open(self.schema_file_path, 'r', encoding='utf-8') as f:
-                schema = json.load(f)
+            # orjson parses the bytes directly; its decode error subclasses
+            # json.JSONDecodeError, so the handler below still applies
+            with open(self.schema_file_path, 'rb') as f:
+                schema = orjson.loads(f.read())
                 if self.debug:
                     print(f"Schema loaded successfully: {len(schema)} tables found")
                 return schema
@@ -4,7 +4,8 @@ Performs BFS traversal on table relationships based on frequency ranking
 """
 
 import json
-from typing import Dict, List, Set, Any
+import orjson
+from typing import Dict, List, Set, Any, Optional
 from collections import deque
 
 try:
@@ -20,23 +21,30 @@ class TableRelationshipTraversal:
     Traverses table relationships using BFS algorithm starting from highest frequency tables.
     """
     
-    def __init__(self, schema_file_path: str = "form_table_schema.json", debug: bool = False):
+    def __init__(
+        self,
+        schema_file_path: str = "form_table_schema.json",
+        debug: bool = False,
+        schema: Optional[Dict[str, Any]] = None
+    ):
         """
         Initialize the traversal algorithm.
         
         Args:
             schema_file_path: Path to the JSON schema file
             debug: Whether to print debug output (default: False)
+            schema: Already loaded schema; the file is not read when given
         """
         self.schema_file_path = schema_file_path
-        self.schema = self._load_schema()
+        self.schema = schema if schema is not None else self._load_schema()
         self.debug = debug
         
     def _load_schema(self) -> Dict[str, Any]:
         """Load the table schema from JSON file."""
         try:
-            with open(self.schema_file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(self.schema_file_path, 'rb') as f:
+                # Decode errors still reach the json.JSONDecodeError handler
+                return orjson.loads(f.read())
         except FileNotFoundError:
             print(f"❌ Error: Schema file '{self.schema_file_path}' not found!")
             return {}